@@ -14,7 +14,6 @@ def create_smoke_scenario():
     """
     # Create building with smoke emergency
     emergency = EmergencyContext(EmergencyType.SMOKE_NO_FIRE, severity=1.5, smoke_density=0.6)
-    building = Building("Smoke Scenario Building", emergency=emergency)
     
     # Create exits
     exit1 = Room("Exit1", area=5.0, room_type=RoomType.EXIT)
@@ -56,19 +55,22 @@ def create_smoke_scenario():
         expected_occupants=1
     )
     
-    # Add rooms
-    for room in [exit1, exit2, hallway, room1, room2, room3, room4]:
-        building.add_room(room)
-    
     # Connect rooms
-    building.add_path("Exit1", "Hallway", distance=5.0)
-    building.add_path("Exit2", "Hallway", distance=5.0)
-    building.add_path("Hallway", "Room1", distance=8.0)
-    building.add_path("Hallway", "Room2", distance=8.0)
-    building.add_path("Hallway", "Room3", distance=8.0)
-    building.add_path("Hallway", "Room4", distance=8.0)
-    
-    return building
+    paths = [
+        ("Exit1", "Hallway", 5.0),
+        ("Exit2", "Hallway", 5.0),
+        ("Hallway", "Room1", 8.0),
+        ("Hallway", "Room2", 8.0),
+        ("Hallway", "Room3", 8.0),
+        ("Hallway", "Room4", 8.0),
+    ]
+    
+    return Building.build(
+        "Smoke Scenario Building",
+        [exit1, exit2, hallway, room1, room2, room3, room4],
+        paths,
+        emergency=emergency,
+    )
 
 
 def run_smoke_scenario_comparison():
@@ -84,12 +86,15 @@ def run_smoke_scenario_comparison():
         (SweepStrategy.PRIORITY_BASED, "Priority Based"),
     ]
     
+    # Build the layout once and restore a fresh copy per strategy
+    snapshot = create_smoke_scenario().snapshot()
+    
     for strategy, name in strategies:
         print(f"\n{'=' * 70}")
         print(f"Testing: {name}")
         print("=" * 70)
         
-        building = create_smoke_scenario()
+        building = Building.from_snapshot(snapshot)
         
         ff1 = Responder(
             "FF1", "Firefighter 1",
@@ -113,11 +118,7 @@ def run_smoke_scenario_comparison():
         
         # Show which rooms were swept in what order
         print("\nSweep order:")
-        events = sorted(
-            [e for e in results['events'] if e[2] == 'SWEPT'],
-            key=lambda x: x[0]
-        )
-        for time, responder, event, room in events:
+        for time, responder, _, room in results['events_swept']:
             room_obj = building.get_room(room)
             smoke_marker = "🔥" if room_obj and room_obj.has_smoke else "  "
             print(f"  {time:6.1f}s - {responder:15s} swept {room:10s} {smoke_marker}")
@@ -125,8 +126,6 @@ def run_smoke_scenario_comparison():
 
 def create_large_building():
     """Create a larger, more complex building."""
-    building = Building("Large Multi-Wing Building")
-    
     # Create exits
     exit1 = Room("Exit_North", area=5.0, room_type=RoomType.EXIT)
     exit2 = Room("Exit_South", area=5.0, room_type=RoomType.EXIT)
@@ -156,37 +155,28 @@ def create_large_building():
         for i in range(1, 4)
     ]
     
-    # Add all rooms
     all_rooms = (
         [exit1, exit2, exit3, main_hall, north_hall, south_hall, east_hall] +
         north_rooms + south_rooms + east_rooms
     )
     
-    for room in all_rooms:
-        building.add_room(room)
-    
     # Connect main structure
-    building.add_path("Exit_North", "Main_Hallway", distance=5.0)
-    building.add_path("Exit_South", "Main_Hallway", distance=5.0)
-    building.add_path("Exit_East", "Main_Hallway", distance=5.0)
-    
-    building.add_path("Main_Hallway", "North_Hallway", distance=8.0)
-    building.add_path("Main_Hallway", "South_Hallway", distance=8.0)
-    building.add_path("Main_Hallway", "East_Hallway", distance=8.0)
-    
-    # Connect north wing rooms
-    for i, room in enumerate(north_rooms):
-        building.add_path("North_Hallway", room.room_id, distance=6.0 + i * 2)
-    
-    # Connect south wing rooms
-    for i, room in enumerate(south_rooms):
-        building.add_path("South_Hallway", room.room_id, distance=6.0 + i * 2)
+    paths = [
+        ("Exit_North", "Main_Hallway", 5.0),
+        ("Exit_South", "Main_Hallway", 5.0),
+        ("Exit_East", "Main_Hallway", 5.0),
+        ("Main_Hallway", "North_Hallway", 8.0),
+        ("Main_Hallway", "South_Hallway", 8.0),
+        ("Main_Hallway", "East_Hallway", 8.0),
+    ]
     
-    # Connect east wing rooms
-    for i, room in enumerate(east_rooms):
-        building.add_path("East_Hallway", room.room_id, distance=6.0 + i * 2)
+    # Connect each wing's rooms to its hallway
+    for hall, wing_rooms in [("North_Hallway", north_rooms),
+                             ("South_Hallway", south_rooms),
+                             ("East_Hallway", east_rooms)]:
+        paths += [(hall, room.room_id, 6.0 + i * 2) for i, room in enumerate(wing_rooms)]
     
-    return building
+    return Building.build("Large Multi-Wing Building", all_rooms, paths)
 
 
 def run_large_building_scenario():
@@ -197,6 +187,7 @@ def run_large_building_scenario():
     
     building = create_large_building()
     stats = building.get_building_stats()
+    snapshot = building.snapshot()
     print(f"\nBuilding size: {stats['total_rooms']} rooms, {stats['total_area']:.0f} m²")
     
     # Test with different numbers of responders
@@ -205,7 +196,7 @@ def run_large_building_scenario():
         print(f"Testing with {num_responders} firefighters")
         print("=" * 70)
         
-        building = create_large_building()
+        building = Building.from_snapshot(snapshot)
         
         responders = [
             Responder(
@@ -1,9 +1,23 @@
 """Building module for representing floor plans with rooms and hallways."""
 
 import networkx as nx
-from typing import Dict, List, Tuple, Optional
+import numpy as np
+from collections import namedtuple
+from functools import lru_cache
+from typing import Dict, Iterator, List, Tuple, Optional, ValuesView
 from room import Room, RoomType
 from emergency import EmergencyContext, EmergencyType
+from kernels import HAVE_NUMBA, MIN_COMPILED_SIZE, compiled_kernels, dijkstra
+
+
+# Immutable copy of a building layout. Rooms are stored as Room constructor
+# argument tuples; the array fields are shared read-only with every building
+# restored from the snapshot (None if they had not been built yet).
+BuildingSnapshot = namedtuple(
+    'BuildingSnapshot',
+    'name emergency rooms room_ids edges indptr indices w '
+    'dist_to_exit nearest_exit apsp_dist apsp_prev'
+)
 
 
 class Building:
@@ -18,10 +32,404 @@ class Building:
             emergency: Emergency context affecting the building (None = normal conditions)
         """
         self.name = name
-        self.graph = nx.Graph()  # Undirected graph for room connections
+        self._graph: Optional[nx.Graph] = None  # networkx view, built on demand
         self.rooms: Dict[str, Room] = {}
         self.exits: List[str] = []  # List of room IDs that are exits
+        # Rooms by insertion position, and a bitmask with bit i set while the
+        # room at position i still needs sweeps (kept current by room callbacks)
+        self._rooms_by_pos: List[Room] = []
+        self._pos: Dict[str, int] = {}
+        # Rooms grouped by priority level, each group in insertion order
+        self._rooms_by_priority: Dict[int, List[Room]] = {}
+        self._unswept_mask = 0
+        # Rooms that are swept but not yet checked by any team
+        self._needs_check_mask = 0
+        # Bitmask of the rooms each team ID appears in the sweep history of
+        self._team_masks: Dict[object, int] = {}
+        self._swept_count = 0  # Rooms with is_swept set, kept current by room callbacks
+        self._total_area = 0.0
         self.emergency = emergency or EmergencyContext(EmergencyType.EVACUATION_DRILL, severity=0.5)
+        # Compressed sparse row (CSR) adjacency used for traversal.
+        # Room i's neighbors are _indices[_indptr[i]:_indptr[i+1]] with
+        # distances _w[_indptr[i]:_indptr[i+1]].
+        self._idx: Dict[str, int] = {}  # room_id -> row index
+        self._room_ids: List[str] = []  # row index -> room_id
+        self._edge_w: Dict[Tuple[int, int], float] = {}  # pending edges
+        self._indptr: Optional[np.ndarray] = None
+        self._indices: Optional[np.ndarray] = None
+        self._w: Optional[np.ndarray] = None
+        # Struct-of-arrays copy of hot room attributes, indexed by row; the
+        # sweep state is kept in sync by the room sweep callbacks, and the
+        # arrays are dropped when a room attribute is assigned
+        self._rooms_by_row: Optional[List[Room]] = None
+        self._is_swept: Optional[np.ndarray] = None
+        self._area: Optional[np.ndarray] = None
+        self._actual_sweeps: Optional[np.ndarray] = None
+        self._required_sweeps: Optional[np.ndarray] = None
+        self._priority_level: Optional[np.ndarray] = None
+        self._id_rank: Optional[np.ndarray] = None  # position of each room ID in sorted order
+        self._has_smoke: Optional[np.ndarray] = None
+        self._is_visible: Optional[np.ndarray] = None
+        self._expected_occupants: Optional[np.ndarray] = None
+        self._exit_mask: Optional[np.ndarray] = None
+        # Distance to, and row of, the nearest exit for every room
+        self._dist_to_exit: Optional[np.ndarray] = None
+        self._nearest_exit: Optional[np.ndarray] = None
+        # All-pairs shortest-path matrices indexed by row, built lazily on
+        # the first path query. _apsp_prev[s, t] is the room before t on a
+        # shortest path from s (-1 if none).
+        self._apsp_dist: Optional[np.ndarray] = None
+        self._apsp_prev: Optional[np.ndarray] = None
+        # Per-building cache of reconstructed (path, distance) results
+        self._sp = lru_cache(maxsize=4096)(self._shortest_path)
+        
+    def __getstate__(self):
+        """Pickle support: the per-instance path cache wraps a bound method and is rebuilt on load."""
+        state = self.__dict__.copy()
+        del state['_sp']
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._sp = lru_cache(maxsize=4096)(self._shortest_path)
+        
+    @property
+    def graph(self) -> nx.Graph:
+        """Undirected networkx view of the layout, built on first access (used for plotting)."""
+        if self._graph is None:
+            graph = nx.Graph()
+            for room_id, room in self.rooms.items():
+                graph.add_node(room_id, room=room)
+            room_ids = self._room_ids
+            for (i, j), distance in self._edge_w.items():
+                graph.add_edge(room_ids[i], room_ids[j], distance=distance)
+            self._graph = graph
+        return self._graph
+    
+    @graph.setter
+    def graph(self, graph: nx.Graph):
+        """
+        Replace every path with the edges of graph (distances from the 'distance' edge attribute).
+        
+        The graph is read once: later changes to it are not tracked, so use
+        add_path to extend the layout afterwards.
+        """
+        edge_w = {}
+        for room1_id, room2_id, distance in graph.edges(data='distance', default=0):
+            for room_id in (room1_id, room2_id):
+                if room_id not in self.rooms:
+                    raise ValueError(f"Room {room_id} not found in building")
+            i, j = self._idx[room1_id], self._idx[room2_id]
+            edge_w[(i, j) if (j, i) not in edge_w else (j, i)] = distance
+        self._edge_w = edge_w
+        self._graph = None
+        self._invalidate_cache()
+    
+    @classmethod
+    def build(cls, name: str, rooms: List[Room], paths: List[Tuple[str, str, float]],
+              emergency: Optional[EmergencyContext] = None) -> 'Building':
+        """
+        Build and finalize a building from a room list and an edge list in one pass.
+        
+        Args:
+            name: Name of the building
+            rooms: Rooms to add, in order
+            paths: (room1_id, room2_id, distance) tuples, equivalent to add_path calls
+            emergency: Emergency context affecting the building (None = normal conditions)
+            
+        Returns:
+            Finalized Building
+        """
+        building = cls(name, emergency=emergency)
+        for room in rooms:
+            building.add_room(room)
+        
+        idx = building._idx
+        missing = {room_id for a, b, _ in paths for room_id in (a, b)} - idx.keys()
+        if missing:
+            raise ValueError(f"Room {sorted(missing)[0]} not found in building")
+        edge_w = building._edge_w
+        for a, b, distance in paths:
+            i, j = idx[a], idx[b]
+            edge_w[(i, j) if (j, i) not in edge_w else (j, i)] = distance
+        building.finalize()
+        return building
+    
+    def snapshot(self) -> BuildingSnapshot:
+        """
+        Freeze the current layout into an immutable, picklable snapshot.
+        
+        Sweep state is not captured: buildings restored from the snapshot
+        start unswept.
+        """
+        if self._indptr is None:
+            self._build_csr()
+        rooms = tuple(
+            (room.room_id, room.area, room.room_type, room.occupant_type, room.has_smoke,
+             room.is_visible, room.visible_fraction, False, False,
+             room.expected_occupants, room.priority_override)
+            for room in self.rooms.values()
+        )
+        return BuildingSnapshot(
+            name=self.name,
+            emergency=self.emergency,
+            rooms=rooms,
+            room_ids=tuple(self._room_ids),
+            edges=tuple(self._edge_w.items()),
+            indptr=self._indptr,
+            indices=self._indices,
+            w=self._w,
+            dist_to_exit=self._dist_to_exit,
+            nearest_exit=self._nearest_exit,
+            apsp_dist=self._apsp_dist,
+            apsp_prev=self._apsp_prev,
+        )
+    
+    @classmethod
+    def from_snapshot(cls, snap: BuildingSnapshot) -> 'Building':
+        """Create a fresh, unswept building from a snapshot without replaying add_path."""
+        building = cls(snap.name, emergency=snap.emergency)
+        for args in snap.rooms:
+            building.add_room(Room(*args))
+        building._room_ids = list(snap.room_ids)
+        building._idx = {room_id: i for i, room_id in enumerate(snap.room_ids)}
+        building._edge_w = dict(snap.edges)
+        building._indptr = snap.indptr
+        building._indices = snap.indices
+        building._w = snap.w
+        building._dist_to_exit = snap.dist_to_exit
+        building._nearest_exit = snap.nearest_exit
+        building._apsp_dist = snap.apsp_dist
+        building._apsp_prev = snap.apsp_prev
+        return building
+    
+    def _invalidate_cache(self):
+        """Drop the CSR arrays and shortest-path tables after the layout changes."""
+        self._indptr = None
+        self._indices = None
+        self._w = None
+        self._drop_soa()
+        self._dist_to_exit = None
+        self._nearest_exit = None
+        self._apsp_dist = None
+        self._apsp_prev = None
+        self._sp.cache_clear()
+    
+    def _drop_soa(self):
+        """Drop the per-row attribute arrays; they are rebuilt on next use."""
+        self._rooms_by_row = None
+        self._is_swept = None
+        self._area = None
+        self._actual_sweeps = None
+        self._required_sweeps = None
+        self._priority_level = None
+        self._id_rank = None
+        self._has_smoke = None
+        self._is_visible = None
+        self._expected_occupants = None
+        self._exit_mask = None
+        
+    def _build_csr(self):
+        """Build the CSR arrays from the pending edge list."""
+        n = len(self._room_ids)
+        m = len(self._edge_w)
+        src = np.empty(2 * m, dtype=np.int64)
+        dst = np.empty(2 * m, dtype=np.int64)
+        w = np.empty(2 * m, dtype=np.float64)
+        for k, ((i, j), distance) in enumerate(self._edge_w.items()):
+            src[2 * k], dst[2 * k], w[2 * k] = i, j, distance
+            src[2 * k + 1], dst[2 * k + 1], w[2 * k + 1] = j, i, distance
+        # Stable sort keeps each room's neighbors in insertion order
+        order = np.argsort(src, kind='stable')
+        self._indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=n), out=self._indptr[1:])
+        self._indices = dst[order]
+        self._w = w[order]
+        
+    def _build_soa(self):
+        """Build the per-row attribute arrays from the Room objects."""
+        rooms = [self.rooms[room_id] for room_id in self._room_ids]
+        self._rooms_by_row = rooms
+        self._is_swept = np.array([room.is_swept for room in rooms], dtype=bool)
+        self._area = np.array([room.area for room in rooms], dtype=np.float64)
+        self._actual_sweeps = np.array([room.actual_sweeps_count for room in rooms], dtype=np.int32)
+        self._required_sweeps = np.array([room.required_sweeps_count for room in rooms], dtype=np.int32)
+        self._priority_level = np.array([room.priority_level for room in rooms], dtype=np.int64)
+        self._id_rank = np.empty(len(rooms), dtype=np.int64)
+        self._id_rank[sorted(range(len(rooms)), key=self._room_ids.__getitem__)] = np.arange(len(rooms))
+        self._has_smoke = np.array([room.has_smoke for room in rooms], dtype=bool)
+        self._is_visible = np.array([room.is_visible for room in rooms], dtype=bool)
+        self._expected_occupants = np.array([room.expected_occupants for room in rooms], dtype=np.float64)
+        self._exit_mask = np.array([room.room_type == RoomType.EXIT for room in rooms], dtype=bool)
+
+    def row_indices(self, room_ids: List[str]) -> np.ndarray:
+        """Get the row index of each room ID, for use with the per-row arrays."""
+        idx = self._idx
+        return np.array([idx[room_id] for room_id in room_ids], dtype=np.int64)
+    
+    def distances_from(self, room_id: str, rows: np.ndarray) -> np.ndarray:
+        """
+        Get shortest-path distances from a room to each of the given rows.
+        
+        Args:
+            room_id: Starting room ID
+            rows: Row indices of the target rooms
+            
+        Returns:
+            Array of distances (inf where unreachable or room_id is unknown)
+        """
+        if room_id not in self._idx:
+            return np.full(len(rows), np.inf)
+        if self._apsp_dist is None:
+            self._build_apsp()
+        return self._apsp_dist[self._idx[room_id], rows]
+    
+    def priority_features(self, rows: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get (has_smoke, is_visible, expected_occupants) arrays for the given rows."""
+        if self._is_swept is None:
+            self._build_soa()
+        return self._has_smoke[rows], self._is_visible[rows], self._expected_occupants[rows]
+    
+    def priority_levels(self, rows: np.ndarray) -> np.ndarray:
+        """Get the priority level (1-5) of each of the given rows."""
+        if self._priority_level is None:
+            self._build_soa()
+        return self._priority_level[rows]
+    
+    def id_ranks(self, rows: np.ndarray) -> np.ndarray:
+        """Get the rank of each given row's room ID among all room IDs in sorted order."""
+        if self._id_rank is None:
+            self._build_soa()
+        return self._id_rank[rows]
+    
+    def exit_indices(self) -> np.ndarray:
+        """Get the row indices of all exit rooms."""
+        if self._exit_mask is None:
+            self._build_soa()
+        return np.flatnonzero(self._exit_mask)
+        
+    def finalize(self):
+        """
+        Build derived tables once all rooms and paths have been added.
+        
+        Reorders rooms for cache-friendly traversal and precomputes exit
+        distances. Adding rooms or paths afterwards is allowed; the tables are
+        then rebuilt lazily.
+        """
+        self.reorder_for_cache()
+        self.precompute_exit_distances()
+        
+    def reorder_for_cache(self):
+        """
+        Renumber rooms so that traversal touches neighboring rows of the CSR arrays.
+        
+        Rooms are visited in order of decreasing degree; each hub (typically a
+        hallway) is placed next, followed immediately by its unplaced neighbors.
+        Room IDs are unaffected, only the internal row indices change.
+        """
+        if self._indptr is None:
+            self._build_csr()
+        n = len(self._room_ids)
+        degree = np.diff(self._indptr)
+        placed = np.zeros(n, dtype=bool)
+        order = []
+        for hub in np.argsort(-degree, kind='stable'):
+            if placed[hub]:
+                continue
+            placed[hub] = True
+            order.append(hub)
+            neighbors = self._indices[self._indptr[hub]:self._indptr[hub + 1]]
+            for j in neighbors[np.argsort(-degree[neighbors], kind='stable')]:
+                if not placed[j]:
+                    placed[j] = True
+                    order.append(j)
+        
+        new_index = np.empty(n, dtype=np.int64)
+        new_index[order] = np.arange(n)
+        self._room_ids = [self._room_ids[i] for i in order]
+        self._idx = {room_id: i for i, room_id in enumerate(self._room_ids)}
+        self._edge_w = {
+            (int(new_index[i]), int(new_index[j])): distance
+            for (i, j), distance in self._edge_w.items()
+        }
+        self._invalidate_cache()
+        
+    def precompute_exit_distances(self):
+        """
+        Compute the distance to the nearest exit for every room.
+        
+        Runs a single multi-source Dijkstra from a virtual source connected to
+        every exit with zero-length edges.
+        """
+        if self._indptr is None:
+            self._build_csr()
+        n = len(self._room_ids)
+        exits = self.exit_indices()
+        # Append the virtual source as row n
+        indptr = np.append(self._indptr, self._indptr[-1] + len(exits))
+        indices = np.concatenate([self._indices, exits])
+        weights = np.concatenate([self._w, np.zeros(len(exits))])
+        kernel = compiled_kernels().dijkstra if HAVE_NUMBA and n >= MIN_COMPILED_SIZE else dijkstra
+        dist, prev = kernel(indptr, indices, weights, n)
+        
+        nearest = np.full(n, -1, dtype=np.int64)
+        for v in range(n):
+            u = v
+            while prev[u] not in (n, -1):
+                u = prev[u]
+            if prev[u] == n:
+                nearest[v] = u
+        self._dist_to_exit = dist[:n]
+        self._nearest_exit = nearest
+        
+    def dist_to_exit(self, room_id: str) -> float:
+        """Get the shortest distance from a room to any exit (inf if none is reachable)."""
+        if self._dist_to_exit is None:
+            self.precompute_exit_distances()
+        return float(self._dist_to_exit[self._idx[room_id]])
+    
+    def nearest_exit(self, room_id: str) -> Optional[str]:
+        """Get the ID of the exit closest to a room, or None if no exit is reachable."""
+        if self._nearest_exit is None:
+            self.precompute_exit_distances()
+        i = self._nearest_exit[self._idx[room_id]]
+        return self._room_ids[i] if i >= 0 else None
+        
+    def precompute_distances(self):
+        """
+        Build the all-pairs shortest-path tables now instead of on the first path query.
+        
+        Calling this before snapshot() lets every building restored from the
+        snapshot share the tables.
+        """
+        if self._apsp_dist is None:
+            self._build_apsp()
+        
+    def _build_apsp(self):
+        """Run Dijkstra once from every room and store distances and predecessors."""
+        if self._indptr is None:
+            self._build_csr()
+        n = len(self._room_ids)
+        self._apsp_dist = np.full((n, n), np.inf)
+        self._apsp_prev = np.full((n, n), -1, dtype=np.int64)
+        if HAVE_NUMBA and n >= MIN_COMPILED_SIZE:
+            kernel = compiled_kernels().dijkstra
+            for s in range(n):
+                self._apsp_dist[s], self._apsp_prev[s] = kernel(
+                    self._indptr, self._indices, self._w, s
+                )
+            return
+        
+        # Without Numba the compiled kernel is unavailable, and on small layouts
+        # it costs more to load than it saves; networkx is faster than running
+        # it as interpreted Python.
+        for s, source in enumerate(self._room_ids):
+            pred, dist = nx.dijkstra_predecessor_and_distance(self.graph, source, weight='distance')
+            for target, d in dist.items():
+                t = self._idx[target]
+                self._apsp_dist[s, t] = d
+                if pred[target]:
+                    self._apsp_prev[s, t] = self._idx[pred[target][0]]
         
     def add_room(self, room: Room):
         """
@@ -30,13 +438,85 @@ class Building:
         Args:
             room: Room object to add
         """
+        replaced = self.rooms.get(room.room_id)
+        if replaced is not None:
+            self._swept_count -= replaced.is_swept
+            self._total_area -= replaced.area
         self.rooms[room.room_id] = room
-        self.graph.add_node(room.room_id, room=room)
+        if replaced is not None:
+            # A replacement keeps the original room's position
+            pos = self._pos[room.room_id]
+            self._rooms_by_pos[pos] = room
+            self._group_by_priority()
+        else:
+            pos = self._pos[room.room_id] = len(self._rooms_by_pos)
+            self._rooms_by_pos.append(room)
+            self._rooms_by_priority.setdefault(room.priority_level, []).append(room)
+        bit = 1 << pos
+        if room.is_fully_swept():
+            self._unswept_mask &= ~bit
+        else:
+            self._unswept_mask |= bit
+        self._update_needs_check(room, bit)
+        team_masks = self._team_masks
+        if replaced is not None:
+            for team_id in team_masks:
+                team_masks[team_id] &= ~bit
+        for team_id in room.get_sweeping_teams():
+            team_masks[team_id] = team_masks.get(team_id, 0) | bit
+        self._swept_count += room.is_swept
+        self._total_area += room.area
+        room.register_sweep_listener(self._on_room_swept)
+        room.register_attribute_listener(self._on_room_changed)
+        if room.room_id not in self._idx:
+            self._idx[room.room_id] = len(self._room_ids)
+            self._room_ids.append(room.room_id)
+        self._graph = None
+        self._invalidate_cache()
         
         # Track exits
         if room.room_type == RoomType.EXIT:
             self.exits.append(room.room_id)
             
+    def _on_room_swept(self, room: Room, was_swept: bool, was_fully_swept: bool, team_id=None):
+        """Room callback: mirror a sweep-state change into the counters, masks and arrays."""
+        if self.rooms.get(room.room_id) is not room:
+            return
+        bit = 1 << self._pos[room.room_id]
+        if not was_fully_swept and room.is_fully_swept():
+            self._unswept_mask &= ~bit
+        if team_id:
+            self._team_masks[team_id] = self._team_masks.get(team_id, 0) | bit
+        self._update_needs_check(room, bit)
+        self._swept_count += room.is_swept - was_swept
+        if self._is_swept is not None:
+            i = self._idx[room.room_id]
+            self._is_swept[i] = room.is_swept
+            self._actual_sweeps[i] = room.actual_sweeps_count
+    
+    def _group_by_priority(self):
+        """Rebuild the priority-level groups from the rooms in insertion order."""
+        by_priority = self._rooms_by_priority = {}
+        for room in self._rooms_by_pos:
+            by_priority.setdefault(room.priority_level, []).append(room)
+    
+    def _on_room_changed(self, room: Room, name: str, old_value):
+        """Room callback: an attribute was assigned, so the per-row arrays may be stale."""
+        if self.rooms.get(room.room_id) is not room:
+            return
+        self._drop_soa()
+        if name == 'area':
+            self._total_area += room.area - old_value
+        elif name == 'priority_level':
+            self._group_by_priority()
+        elif name == 'room_type' and (old_value == RoomType.EXIT) != (room.room_type == RoomType.EXIT):
+            if room.room_type == RoomType.EXIT:
+                self.exits.append(room.room_id)
+            else:
+                self.exits.remove(room.room_id)
+            self._dist_to_exit = None
+            self._nearest_exit = None
+            
     def add_path(self, room1_id: str, room2_id: str, distance: float):
         """
         Add a path (connection) between two rooms.
@@ -51,7 +531,10 @@ class Building:
         if room2_id not in self.rooms:
             raise ValueError(f"Room {room2_id} not found in building")
             
-        self.graph.add_edge(room1_id, room2_id, distance=distance)
+        self._graph = None
+        i, j = self._idx[room1_id], self._idx[room2_id]
+        self._edge_w[(i, j) if (j, i) not in self._edge_w else (j, i)] = distance
+        self._invalidate_cache()
         
     def get_room(self, room_id: str) -> Optional[Room]:
         """Get a room by its ID."""
@@ -68,20 +551,35 @@ class Building:
         Returns:
             Distance in meters, or float('inf') if not connected
         """
-        if self.graph.has_edge(room1_id, room2_id):
-            return self.graph[room1_id][room2_id]['distance']
+        if room1_id not in self._idx or room2_id not in self._idx:
+            return float('inf')
+        if self._indptr is None:
+            self._build_csr()
+        i, j = self._idx[room1_id], self._idx[room2_id]
+        lo, hi = self._indptr[i], self._indptr[i + 1]
+        hits = np.flatnonzero(self._indices[lo:hi] == j)
+        if hits.size:
+            return float(self._w[lo + hits[0]])
         return float('inf')
     
     def get_neighbors(self, room_id: str) -> List[str]:
         """Get all rooms connected to the given room."""
-        if room_id in self.graph:
-            return list(self.graph.neighbors(room_id))
-        return []
+        i = self._idx.get(room_id)
+        if i is None:
+            return []
+        if self._indptr is None:
+            self._build_csr()
+        room_ids = self._room_ids
+        return [room_ids[j] for j in self._indices[self._indptr[i]:self._indptr[i + 1]]]
     
     def get_shortest_path(self, start_id: str, end_id: str) -> Tuple[List[str], float]:
         """
         Get the shortest path between two rooms.
         
+        Paths are read from an all-pairs table that is computed on the first
+        query and reused until a room or path is added. Results are cached
+        per (start, end) pair; each call returns its own copy of the path.
+        
         Args:
             start_id: Starting room ID
             end_id: Ending room ID
@@ -89,26 +587,91 @@ class Building:
         Returns:
             Tuple of (path as list of room IDs, total distance)
         """
-        try:
-            path = nx.shortest_path(
-                self.graph, 
-                start_id, 
-                end_id, 
-                weight='distance'
-            )
-            distance = nx.shortest_path_length(
-                self.graph, 
-                start_id, 
-                end_id, 
-                weight='distance'
-            )
-            return path, distance
-        except nx.NetworkXNoPath:
+        path, distance = self._sp(start_id, end_id)
+        return list(path), distance
+    
+    def get_shortest_path_to(self, start_id: str, end_id: str) -> Tuple[List[str], float]:
+        """
+        Get the shortest path between two rooms without building the all-pairs table.
+        
+        Once the all-pairs table exists this is the same as get_shortest_path.
+        Before that, a single Dijkstra search runs from start_id and stops as
+        soon as end_id is settled.
+        
+        Args:
+            start_id: Starting room ID
+            end_id: Ending room ID
+            
+        Returns:
+            Tuple of (path as list of room IDs, total distance)
+        """
+        if self._apsp_dist is not None:
+            return self.get_shortest_path(start_id, end_id)
+        if start_id not in self._idx or end_id not in self._idx:
+            return [], float('inf')
+        if not HAVE_NUMBA or len(self._room_ids) < MIN_COMPILED_SIZE:
+            try:
+                distance, path = nx.single_source_dijkstra(self.graph, start_id, end_id, weight='distance')
+            except nx.NetworkXNoPath:
+                return [], float('inf')
+            return path, float(distance)
+        
+        if self._indptr is None:
+            self._build_csr()
+        s, t = self._idx[start_id], self._idx[end_id]
+        dist, prev = compiled_kernels().dijkstra(self._indptr, self._indices, self._w, s, t)
+        distance = dist[t]
+        if distance == np.inf:
             return [], float('inf')
+        room_ids = self._room_ids
+        path = [end_id]
+        while t != s:
+            t = prev[t]
+            path.append(room_ids[t])
+        path.reverse()
+        return path, float(distance)
+    
+    def _shortest_path(self, start_id: str, end_id: str) -> Tuple[List[str], float]:
+        """Uncached body of get_shortest_path."""
+        if start_id not in self._idx or end_id not in self._idx:
+            return [], float('inf')
+        if self._apsp_dist is None:
+            self._build_apsp()
+        s, t = self._idx[start_id], self._idx[end_id]
+        distance = self._apsp_dist[s, t]
+        if distance == np.inf:
+            return [], float('inf')
+        
+        # Walk the predecessor chain back from the target
+        prev = self._apsp_prev[s]
+        room_ids = self._room_ids
+        path = [end_id]
+        while t != s:
+            t = prev[t]
+            path.append(room_ids[t])
+        path.reverse()
+        return path, float(distance)
+    
+    def all_pairs_distances(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get the shortest-path distance between every pair of rooms.
+        
+        Returns:
+            Nested dict where result[a][b] is the distance from room a to room b
+            (inf if unreachable)
+        """
+        if self._apsp_dist is None:
+            self._build_apsp()
+        room_ids = self._room_ids
+        return {source: dict(zip(room_ids, row)) for source, row in zip(room_ids, self._apsp_dist.tolist())}
     
-    def get_all_rooms(self) -> List[Room]:
-        """Get all rooms in the building."""
-        return list(self.rooms.values())
+    def get_all_rooms(self) -> ValuesView[Room]:
+        """Get a live view of all rooms in the building (do not mutate the building while iterating)."""
+        return self.rooms.values()
+    
+    def rooms_by_priority(self) -> Dict[int, List[Room]]:
+        """Get the rooms grouped by priority level, each group in insertion order (do not mutate)."""
+        return self._rooms_by_priority
     
     def get_unswept_rooms(self) -> List[Room]:
         """
@@ -119,34 +682,81 @@ class Building:
         
         For backward compatibility, also returns rooms with is_swept=False.
         """
-        return [room for room in self.rooms.values() if not room.is_fully_swept()]
+        return self.rooms_in_mask(self._unswept_mask)
+    
+    def iter_unswept(self) -> Iterator[Room]:
+        """Iterate over rooms that still need sweeps, in insertion order."""
+        # Iterate a snapshot so callers may sweep rooms while iterating
+        return iter(self.rooms_in_mask(self._unswept_mask))
+    
+    def unswept_mask(self) -> int:
+        """Bitmask of the rooms still needing sweeps; bit i is the i-th room added."""
+        return self._unswept_mask
+    
+    def room_bit(self, room_id: str) -> int:
+        """Bit for a room in unswept_mask() and the other room bitmasks."""
+        return 1 << self._pos[room_id]
+    
+    def team_swept_mask(self, team_id) -> int:
+        """Bitmask of the rooms a team has swept (see Room.was_swept_by_team)."""
+        return self._team_masks.get(team_id, 0)
+    
+    def needs_check_mask(self) -> int:
+        """Bitmask of the rooms that are swept but not yet checked by a team."""
+        return self._needs_check_mask
+    
+    def _update_needs_check(self, room: Room, bit: int):
+        """Set or clear a room's bit in the needs-check mask from its current state."""
+        if room.is_swept and room.checked_by_team is None:
+            self._needs_check_mask |= bit
+        else:
+            self._needs_check_mask &= ~bit
+    
+    def mask_of(self, rooms) -> int:
+        """Bitmask with the bit of each given room set."""
+        mask = 0
+        pos = self._pos
+        for room in rooms:
+            mask |= 1 << pos[room.room_id]
+        return mask
+    
+    def rooms_in_mask(self, mask: int, limit: Optional[int] = None) -> List[Room]:
+        """Rooms whose bits are set in mask, in insertion order (at most limit of them)."""
+        rooms = self._rooms_by_pos
+        result = []
+        if limit is None:
+            limit = len(rooms)
+        while mask and len(result) < limit:
+            low = mask & -mask
+            result.append(rooms[low.bit_length() - 1])
+            mask ^= low
+        return result
     
     def has_unswept_rooms(self) -> bool:
         """Check if there are any rooms needing more sweeps."""
-        return any(not room.is_fully_swept() for room in self.rooms.values())
+        return self._unswept_mask != 0
     
     def is_fully_swept(self) -> bool:
         """Check if all rooms have received all required sweeps."""
-        return all(room.is_fully_swept() for room in self.rooms.values())
+        return self._unswept_mask == 0
     
     def reset_sweep_status(self):
         """Reset all rooms to unswept state and clear team tracking."""
         for room in self.rooms.values():
-            room.is_swept = False
-            room.is_checked = False
-            room.sweep_time = None
-            room.swept_by_team = None
-            room.checked_by_team = None
-            room.needs_resweep = False
-            # Reset priority tracking
-            room.actual_sweeps_count = 0
-            room.sweep_history = []
+            room.reset_sweep_status()
+        self._unswept_mask = self.mask_of(room for room in self.rooms.values() if not room.is_fully_swept())
+        self._team_masks = {}
+        self._needs_check_mask = 0
+        self._swept_count = 0
+        if self._is_swept is not None:
+            self._is_swept[:] = False
+            self._actual_sweeps[:] = 0
             
     def get_building_stats(self) -> Dict:
         """Get statistics about the building."""
         total_rooms = len(self.rooms)
-        swept_rooms = sum(1 for room in self.rooms.values() if room.is_swept)
-        total_area = sum(room.area for room in self.rooms.values())
+        swept_rooms = self._swept_count
+        total_area = self._total_area
         
         return {
             'total_rooms': total_rooms,
@@ -160,7 +770,7 @@ class Building:
     def __repr__(self) -> str:
         """String representation of the building."""
         stats = self.get_building_stats()
-        emergency_str = f", {self.emergency.emergency_type.value}" if self.emergency else ""
+        emergency_str = f", {self.emergency.emergency_type.label}" if self.emergency else ""
         return (f"Building({self.name}, "
                 f"{stats['total_rooms']} rooms, "
                 f"{stats['num_exits']} exits{emergency_str})")
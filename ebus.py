@@ -27,15 +27,31 @@ cities = ["Phoenix", "Dallas", "Charlotte"]
 # C5: Job impacts "gained/lost" -> we convert to net jobs gained (higher better)
 # C6: Climate/health benefits (annual $, higher is better)
 
-data = {
-    'C1_maintenance_savings': np.array([53_050_000, 34_600_000, 16_150_000], dtype=float),
-    'C2_bus_transition_cost': np.array([350_000_000, 245_000_000, 105_000_000], dtype=float),
-    'C3_battery_per_mile': np.array([20.0, 14.0, 6.0], dtype=float),
-    'C4_pollution_tons_saved': np.array([8000.0, 5600.0, 2400.0], dtype=float),
-    # job impacts are 'gained/lost' strings in prompt; convert to net gained
-    'C5_net_jobs_gained': np.array([350 - 150, 245 - 105, 105 - 45], dtype=float),
-    'C6_climate_health_benefits': np.array([163_400_000, 114_380_000, 49_020_000], dtype=float),
-}
+criteria_keys = [
+    'C1_maintenance_savings',
+    'C2_bus_transition_cost',
+    'C3_battery_per_mile',
+    'C4_pollution_tons_saved',
+    'C5_net_jobs_gained',
+    'C6_climate_health_benefits',
+]
+col = {key: i for i, key in enumerate(criteria_keys)}
+
+# Criteria matrix, shape (n_cities, n_criteria), columns in criteria_keys order.
+# Job impacts are 'gained/lost' strings in prompt; converted to net gained.
+X = np.array([
+    # C1          C2           C3    C4      C5         C6
+    [53_050_000, 350_000_000, 20.0, 8000.0, 350 - 150, 163_400_000],  # Phoenix
+    [34_600_000, 245_000_000, 14.0, 5600.0, 245 - 105, 114_380_000],  # Dallas
+    [16_150_000, 105_000_000, 6.0, 2400.0, 105 - 45, 49_020_000],     # Charlotte
+], dtype=float)
+
+# Whether higher values are better for each criterion (C2, C3 are costs)
+is_benefit = np.array([True, False, False, True, True, True])
+
+# Per-criterion views of X and the benefit directions, keyed by criterion name
+data = {key: X[:, i] for key, i in col.items()}
+benefit_direction = dict(zip(criteria_keys, is_benefit.tolist()))
 
 # AHP weights from your ranking (map to C1..C6 as described)
 weights = {
@@ -47,59 +63,35 @@ weights = {
     'C3_battery_per_mile': 0.068,
 }
 
-criteria_keys = [
-    'C1_maintenance_savings',
-    'C2_bus_transition_cost',
-    'C3_battery_per_mile',
-    'C4_pollution_tons_saved',
-    'C5_net_jobs_gained',
-    'C6_climate_health_benefits',
-]
+# Column order used for the AHP table and weight vector (ranking order)
+ahp_order = [col[key] for key in weights]
 
-# Define whether higher values are better for each criterion
-benefit_direction = {
-    'C1_maintenance_savings': True,
-    'C2_bus_transition_cost': False,  # cost: lower is better
-    'C3_battery_per_mile': False,     # cost per mile: lower is better
-    'C4_pollution_tons_saved': True,
-    'C5_net_jobs_gained': True,
-    'C6_climate_health_benefits': True,
-}
 
+def minmax_normalize(X, axis=0):
+    """Min-max normalize X along axis; constant slices map to 0.5 (neutral)."""
+    mn = np.nanmin(X, axis=axis, keepdims=True)
+    mx = np.nanmax(X, axis=axis, keepdims=True)
+    rng = mx - mn
+    varies = rng > 0
+    return np.where(varies, (X - mn) / np.where(varies, rng, 1.0), 0.5)
 
-def minmax_normalize(arr):
-    mn = np.nanmin(arr)
-    mx = np.nanmax(arr)
-    if mx == mn:
-        # all same -> return 0.5 neutral
-        return np.full_like(arr, 0.5)
-    return (arr - mn) / (mx - mn)
 
+def normalize(X, is_benefit):
+    """Normalize all criteria at once, inverting cost columns so larger is always better."""
+    norm = minmax_normalize(X)
+    return np.where(is_benefit, norm, 1.0 - norm)
 
-# Build normalized matrix (cities x criteria_in_weights_order)
-norm_matrix = []
-for key in ['C6_climate_health_benefits', 'C1_maintenance_savings', 'C4_pollution_tons_saved',
-            'C2_bus_transition_cost', 'C5_net_jobs_gained', 'C3_battery_per_mile']:
-    arr = data[key]
-    norm = minmax_normalize(arr)
-    if not benefit_direction.get(key, True):
-        norm = 1.0 - norm  # invert so larger is always better
-    norm_matrix.append(norm)
 
-norm_matrix = np.vstack(norm_matrix).T  # shape (n_cities, n_criteria)
+# Normalized matrix (cities x criteria_in_weights_order)
+norm_matrix = normalize(X, is_benefit)[:, ahp_order]
 
-# Create weight vector in the same order
-weight_vector = np.array([
-    weights['C6_climate_health_benefits'],
-    weights['C1_maintenance_savings'],
-    weights['C4_pollution_tons_saved'],
-    weights['C2_bus_transition_cost'],
-    weights['C5_net_jobs_gained'],
-    weights['C3_battery_per_mile'],
-])
+# Weight vector in the same order
+weight_vector = np.array(list(weights.values()))
 
-# Compute weighted AHP score (higher -> better candidate for transition)
-scores = norm_matrix.dot(weight_vector)
+# Compute weighted AHP score (higher -> better candidate for transition).
+# One small matmul over the few cities; a compiled kernel would cost more to
+# build than this takes.
+scores = norm_matrix @ weight_vector
 
 
 def print_table():
@@ -137,12 +129,18 @@ def estimate_net_annual(amort_years=12, annual_miles=100_000_000):
     - C2 is treated as an up-front cost amortized over amort_years (user-provided assumption)
     - annual_miles is a scenario parameter (total fleet miles per year). The prompt did not
       provide fleet miles, so we present a few scenarios below.
+    - amort_years and annual_miles may each be a scalar or a 1-D array of scenarios.
+      With scalars the result has one value per city; otherwise it has shape
+      (n_scenarios, n_cities), with one row per scenario.
     """
-    maint = data['C1_maintenance_savings']
-    climate = data['C6_climate_health_benefits']
-    transition = data['C2_bus_transition_cost'] / amort_years
-    battery_cost = data['C3_battery_per_mile'] * annual_miles
-    net = maint + climate - transition - battery_cost
+    years = np.reshape(amort_years, (-1, 1))
+    miles = np.reshape(annual_miles, (-1, 1))
+    maint = X[:, col['C1_maintenance_savings']]
+    climate = X[:, col['C6_climate_health_benefits']]
+    transition = X[:, col['C2_bus_transition_cost']] / years
+    net = maint + climate - transition - X[:, col['C3_battery_per_mile']] * miles
+    if np.ndim(amort_years) == 0 and np.ndim(annual_miles) == 0:
+        return net[0]
     return net
 
 
@@ -162,14 +160,14 @@ if __name__ == '__main__':
     }
     print('\nEstimated net annual economic impact (assumptions below):')
     print(f'- amortization years for transition cost: {amort_years} (transition cost / years)')
-    for name, miles in scenarios.items():
-        net = estimate_net_annual(amort_years=amort_years, annual_miles=miles)
+    nets = estimate_net_annual(amort_years=amort_years, annual_miles=np.array(list(scenarios.values())))
+    for (name, miles), net in zip(scenarios.items(), nets):
         print(f"{name:12s} (annual miles={miles:,}):")
         for city, val in zip(cities, net):
             print(f"  - {city:8s}: ${val:,.0f}")
 
     # Plot the mid-mileage net annual results
-    mid_net = estimate_net_annual(amort_years=amort_years, annual_miles=scenarios['mid_mileage'])
+    mid_net = nets[list(scenarios).index('mid_mileage')]
     fig, ax = plt.subplots(figsize=(7, 4))
     colors = ['#2ca02c' if v >= 0 else '#d62728' for v in mid_net]
     ax.bar(cities, mid_net, color=colors)
@@ -1,10 +1,10 @@
 """Emergency type module for modeling different emergency scenarios."""
 
-from enum import Enum
+from enum import IntEnum
 from typing import Optional
 
 
-class EmergencyType(Enum):
+class EmergencyType(IntEnum):
     """
     Types of emergencies that affect building sweep operations.
     
@@ -13,21 +13,123 @@ class EmergencyType(Enum):
     - Visibility impact: How much smoke/obscuration affects operations
     - Movement impact: Speed reduction for responders
     - Occupant response: How quickly occupants recognize danger
+    
+    Members are small ints so that table lookups hash as plain integers;
+    the human-readable name is available as `label`, and the type can still
+    be looked up by it: EmergencyType("fire") or EmergencyType.from_label("fire").
     """
     
     # Noticeable emergencies (immediate awareness)
-    FIRE = "fire"                          # Visible flames, smoke, heat
-    STRUCTURAL_COLLAPSE = "structural"     # Visible damage, noise
-    FLOOD = "flood"                        # Visible water
+    FIRE = 1                   # Visible flames, smoke, heat
+    STRUCTURAL_COLLAPSE = 2    # Visible damage, noise
+    FLOOD = 3                  # Visible water
     
     # Unnoticeable emergencies (delayed awareness)
-    GAS_LEAK = "gas_leak"                  # Odorless/subtle until severe
-    CO_LEAK = "carbon_monoxide"            # Completely odorless
-    CHEMICAL_LEAK = "chemical"             # May be odorless initially
+    GAS_LEAK = 4               # Odorless/subtle until severe
+    CO_LEAK = 5                # Completely odorless
+    CHEMICAL_LEAK = 6          # May be odorless initially
     
     # Hybrid/variable
-    SMOKE_NO_FIRE = "smoke_only"           # Smoke without active fire
-    EVACUATION_DRILL = "drill"             # No actual emergency
+    SMOKE_NO_FIRE = 7          # Smoke without active fire
+    EVACUATION_DRILL = 8       # No actual emergency
+    
+    @property
+    def label(self) -> str:
+        """Short lowercase name used in reports (e.g. "carbon_monoxide")."""
+        return EMERGENCY_LABELS[self]
+    
+    @classmethod
+    def from_label(cls, label: str) -> 'EmergencyType':
+        """Emergency type with the given label (e.g. "gas_leak"); raises ValueError if unknown."""
+        try:
+            return _TYPES_BY_LABEL[label]
+        except KeyError:
+            raise ValueError(f"{label!r} is not a valid {cls.__name__} label") from None
+    
+    @classmethod
+    def _missing_(cls, value):
+        """Accept the label strings that were the member values before they became ints."""
+        return _TYPES_BY_LABEL.get(value) if isinstance(value, str) else None
+
+
+EMERGENCY_LABELS = {
+    EmergencyType.FIRE: "fire",
+    EmergencyType.STRUCTURAL_COLLAPSE: "structural",
+    EmergencyType.FLOOD: "flood",
+    EmergencyType.GAS_LEAK: "gas_leak",
+    EmergencyType.CO_LEAK: "carbon_monoxide",
+    EmergencyType.CHEMICAL_LEAK: "chemical",
+    EmergencyType.SMOKE_NO_FIRE: "smoke_only",
+    EmergencyType.EVACUATION_DRILL: "drill",
+}
+_TYPES_BY_LABEL = {label: emergency_type for emergency_type, label in EMERGENCY_LABELS.items()}
+
+
+# Per-type lookup tables, built once at import rather than on every call
+_NOTICEABLE_TYPES = frozenset({
+    EmergencyType.FIRE,
+    EmergencyType.STRUCTURAL_COLLAPSE,
+    EmergencyType.FLOOD,
+    EmergencyType.SMOKE_NO_FIRE,
+    EmergencyType.EVACUATION_DRILL,
+})
+
+# Occupant response delay for unnoticeable emergencies
+_RESPONSE_DELAYS = {
+    EmergencyType.CO_LEAK: 2.5,        # Most dangerous: occupants may be unconscious
+    EmergencyType.GAS_LEAK: 2.0,       # Occupants slow to recognize danger
+    EmergencyType.CHEMICAL_LEAK: 2.2,  # Depends on chemical, assume dangerous
+}
+
+# Base speed reduction by emergency type
+_SPEED_IMPACTS = {
+    EmergencyType.FIRE: 0.7,                   # Heat, smoke, avoiding flames
+    EmergencyType.STRUCTURAL_COLLAPSE: 0.6,    # Debris, unstable structure
+    EmergencyType.FLOOD: 0.5,                  # Water resistance
+    EmergencyType.SMOKE_NO_FIRE: 0.8,          # Smoke without heat
+    EmergencyType.GAS_LEAK: 0.9,               # Cautious movement, breathing gear
+    EmergencyType.CO_LEAK: 0.95,               # Nearly normal, but cautious
+    EmergencyType.CHEMICAL_LEAK: 0.85,         # Protective gear, caution
+    EmergencyType.EVACUATION_DRILL: 1.0,       # Normal speed
+}
+
+_DIFFICULTY_BY_TYPE = {
+    EmergencyType.FIRE: 1.5,                   # Heat, smoke, evolving conditions
+    EmergencyType.STRUCTURAL_COLLAPSE: 1.8,    # Dangerous, need to check debris
+    EmergencyType.FLOOD: 1.4,                  # Water obstacles
+    EmergencyType.SMOKE_NO_FIRE: 1.3,          # Visibility issues
+    EmergencyType.GAS_LEAK: 1.6,               # Need detection equipment, thorough check
+    EmergencyType.CO_LEAK: 1.7,                # Invisible threat, need CO detector, check unconscious victims
+    EmergencyType.CHEMICAL_LEAK: 1.8,          # Protective gear, decontamination concerns
+    EmergencyType.EVACUATION_DRILL: 0.9,       # Easier, no real danger
+}
+
+_PRIORITY_BONUSES = {
+    EmergencyType.FIRE: 200,                   # Immediate danger
+    EmergencyType.STRUCTURAL_COLLAPSE: 250,    # Extreme danger
+    EmergencyType.CO_LEAK: 180,                # Silent killer, high priority
+    EmergencyType.GAS_LEAK: 170,               # Explosion risk
+    EmergencyType.CHEMICAL_LEAK: 190,          # Health hazard
+    EmergencyType.FLOOD: 150,                  # Significant danger
+    EmergencyType.SMOKE_NO_FIRE: 140,          # Moderate danger
+    EmergencyType.EVACUATION_DRILL: 50,        # Low priority
+}
+
+# Emergencies that fill the building with smoke by default
+_SMOKY_TYPES = frozenset({EmergencyType.FIRE, EmergencyType.SMOKE_NO_FIRE})
+
+# Emergencies that need gas detectors, thermal cameras, etc.
+_DETECTION_TYPES = frozenset({
+    EmergencyType.GAS_LEAK,
+    EmergencyType.CO_LEAK,
+    EmergencyType.CHEMICAL_LEAK,
+})
+
+# Emergencies that can leave occupants unconscious or impaired
+_UNCONSCIOUS_TYPES = frozenset({
+    EmergencyType.CO_LEAK,
+    EmergencyType.CHEMICAL_LEAK,
+})
 
 
 class EmergencyContext:
@@ -41,6 +143,12 @@ class EmergencyContext:
     - Occupant awareness and response times
     """
     
+    __slots__ = (
+        'emergency_type', 'severity', 'has_smoke', 'smoke_density',
+        '_is_noticeable', '_occupant_mult', '_visibility_mult',
+        '_movement_mult', '_difficulty_mult', '_priority_bonus', '_repr',
+    )
+    
     def __init__(
         self,
         emergency_type: EmergencyType,
@@ -58,15 +166,29 @@ class EmergencyContext:
             smoke_density: Density of smoke (0.0=none to 1.0=complete obscuration)
         """
         self.emergency_type = emergency_type
-        self.severity = max(0.1, min(3.0, severity))  # Clamp between 0.1 and 3.0
+        # Clamp between 0.1 and 3.0
+        self.severity = 3.0 if severity > 3.0 else 0.1 if severity < 0.1 else severity
         self.has_smoke = has_smoke
-        self.smoke_density = max(0.0, min(1.0, smoke_density))  # Clamp 0-1
+        # Clamp 0-1
+        self.smoke_density = 1.0 if smoke_density > 1.0 else 0.0 if smoke_density < 0.0 else smoke_density
         
         # Set smoke properties based on emergency type if not explicitly set
         if not has_smoke:
-            if emergency_type in [EmergencyType.FIRE, EmergencyType.SMOKE_NO_FIRE]:
+            if emergency_type in _SMOKY_TYPES:
                 self.has_smoke = True
                 self.smoke_density = 0.7 if emergency_type == EmergencyType.FIRE else 0.5
+        
+        # The context never changes after construction, so every multiplier
+        # is computed once here and the getters just return it.
+        self._is_noticeable = self.emergency_type in _NOTICEABLE_TYPES
+        self._occupant_mult = self._compute_occupant_response_multiplier()
+        self._visibility_mult = self._compute_visibility_multiplier()
+        self._movement_mult = self._compute_movement_speed_multiplier()
+        self._difficulty_mult = _DIFFICULTY_BY_TYPE.get(self.emergency_type, 1.2) * self.severity
+        self._priority_bonus = _PRIORITY_BONUSES.get(self.emergency_type, 100) * self.severity
+        smoke_str = f", smoke={self.smoke_density:.1f}" if self.has_smoke else ""
+        self._repr = (f"EmergencyContext({self.emergency_type.label}, "
+                      f"severity={self.severity:.1f}{smoke_str})")
     
     def is_noticeable(self) -> bool:
         """
@@ -76,14 +198,7 @@ class EmergencyContext:
             True for noticeable emergencies (fire, flood, structural)
             False for unnoticeable emergencies (gas, CO)
         """
-        noticeable = {
-            EmergencyType.FIRE,
-            EmergencyType.STRUCTURAL_COLLAPSE,
-            EmergencyType.FLOOD,
-            EmergencyType.SMOKE_NO_FIRE,
-            EmergencyType.EVACUATION_DRILL,
-        }
-        return self.emergency_type in noticeable
+        return self._is_noticeable
     
     def get_occupant_response_multiplier(self) -> float:
         """
@@ -99,10 +214,14 @@ class EmergencyContext:
             1.0 = normal response (noticeable emergency)
             1.5-3.0 = delayed response (unnoticeable emergency)
         """
+        return self._occupant_mult
+    
+    def _compute_occupant_response_multiplier(self) -> float:
+        """Compute the value returned by get_occupant_response_multiplier."""
         if self.emergency_type == EmergencyType.EVACUATION_DRILL:
             return 0.8  # Occupants respond quickly, no panic
         
-        if self.is_noticeable():
+        if self._is_noticeable:
             # Noticeable emergencies: occupants are alert and responsive
             return 1.0 * self.severity
         else:
@@ -110,12 +229,7 @@ class EmergencyContext:
             # - Unaware of danger
             # - Impaired (CO poisoning causes confusion/unconsciousness)
             # - Resistant to evacuation ("I don't smell anything")
-            response_delays = {
-                EmergencyType.CO_LEAK: 2.5,        # Most dangerous: occupants may be unconscious
-                EmergencyType.GAS_LEAK: 2.0,       # Occupants slow to recognize danger
-                EmergencyType.CHEMICAL_LEAK: 2.2,  # Depends on chemical, assume dangerous
-            }
-            base_delay = response_delays.get(self.emergency_type, 1.5)
+            base_delay = _RESPONSE_DELAYS.get(self.emergency_type, 1.5)
             return base_delay * self.severity
     
     def get_visibility_multiplier(self) -> float:
@@ -127,6 +241,10 @@ class EmergencyContext:
             1.0 = perfect visibility
             1.5-3.0 = reduced visibility (proportional to smoke density)
         """
+        return self._visibility_mult
+    
+    def _compute_visibility_multiplier(self) -> float:
+        """Compute the value returned by get_visibility_multiplier."""
         if not self.has_smoke or self.smoke_density == 0:
             return 1.0
         
@@ -149,19 +267,11 @@ class EmergencyContext:
             1.0 = normal speed
             0.5-0.9 = reduced speed
         """
-        # Base speed reduction by emergency type
-        speed_impacts = {
-            EmergencyType.FIRE: 0.7,                   # Heat, smoke, avoiding flames
-            EmergencyType.STRUCTURAL_COLLAPSE: 0.6,    # Debris, unstable structure
-            EmergencyType.FLOOD: 0.5,                  # Water resistance
-            EmergencyType.SMOKE_NO_FIRE: 0.8,          # Smoke without heat
-            EmergencyType.GAS_LEAK: 0.9,               # Cautious movement, breathing gear
-            EmergencyType.CO_LEAK: 0.95,               # Nearly normal, but cautious
-            EmergencyType.CHEMICAL_LEAK: 0.85,         # Protective gear, caution
-            EmergencyType.EVACUATION_DRILL: 1.0,       # Normal speed
-        }
-        
-        base_speed = speed_impacts.get(self.emergency_type, 0.9)
+        return self._movement_mult
+    
+    def _compute_movement_speed_multiplier(self) -> float:
+        """Compute the value returned by get_movement_speed_multiplier."""
+        base_speed = _SPEED_IMPACTS.get(self.emergency_type, 0.9)
         
         # Additional penalty for smoke density
         if self.has_smoke:
@@ -189,36 +299,16 @@ class EmergencyContext:
             1.0 = normal difficulty
             1.2-2.0 = increased difficulty
         """
-        difficulty_by_type = {
-            EmergencyType.FIRE: 1.5,                   # Heat, smoke, evolving conditions
-            EmergencyType.STRUCTURAL_COLLAPSE: 1.8,    # Dangerous, need to check debris
-            EmergencyType.FLOOD: 1.4,                  # Water obstacles
-            EmergencyType.SMOKE_NO_FIRE: 1.3,          # Visibility issues
-            EmergencyType.GAS_LEAK: 1.6,               # Need detection equipment, thorough check
-            EmergencyType.CO_LEAK: 1.7,                # Invisible threat, need CO detector, check unconscious victims
-            EmergencyType.CHEMICAL_LEAK: 1.8,          # Protective gear, decontamination concerns
-            EmergencyType.EVACUATION_DRILL: 0.9,       # Easier, no real danger
-        }
-        
-        base_difficulty = difficulty_by_type.get(self.emergency_type, 1.2)
-        
-        # Severity increases difficulty
-        return base_difficulty * self.severity
+        # Base difficulty by type, scaled by severity
+        return self._difficulty_mult
     
     def requires_detection_equipment(self) -> bool:
         """Check if emergency requires special detection equipment (gas detector, thermal camera, etc.)."""
-        return self.emergency_type in [
-            EmergencyType.GAS_LEAK,
-            EmergencyType.CO_LEAK,
-            EmergencyType.CHEMICAL_LEAK,
-        ]
+        return self.emergency_type in _DETECTION_TYPES
     
     def affects_occupant_consciousness(self) -> bool:
         """Check if emergency can render occupants unconscious or impaired."""
-        return self.emergency_type in [
-            EmergencyType.CO_LEAK,
-            EmergencyType.CHEMICAL_LEAK,
-        ]
+        return self.emergency_type in _UNCONSCIOUS_TYPES
     
     def get_priority_bonus(self) -> float:
         """
@@ -229,23 +319,11 @@ class EmergencyContext:
         Returns:
             Priority bonus (added to room priority scores)
         """
-        priority_bonuses = {
-            EmergencyType.FIRE: 200,                   # Immediate danger
-            EmergencyType.STRUCTURAL_COLLAPSE: 250,    # Extreme danger
-            EmergencyType.CO_LEAK: 180,                # Silent killer, high priority
-            EmergencyType.GAS_LEAK: 170,               # Explosion risk
-            EmergencyType.CHEMICAL_LEAK: 190,          # Health hazard
-            EmergencyType.FLOOD: 150,                  # Significant danger
-            EmergencyType.SMOKE_NO_FIRE: 140,          # Moderate danger
-            EmergencyType.EVACUATION_DRILL: 50,        # Low priority
-        }
-        return priority_bonuses.get(self.emergency_type, 100) * self.severity
+        return self._priority_bonus
     
     def __repr__(self) -> str:
-        """String representation of emergency context."""
-        smoke_str = f", smoke={self.smoke_density:.1f}" if self.has_smoke else ""
-        return (f"EmergencyContext({self.emergency_type.value}, "
-                f"severity={self.severity:.1f}{smoke_str})")
+        """String representation of emergency context (built once in __init__)."""
+        return self._repr
 
 
 # Preset emergency contexts for common scenarios
@@ -1,11 +1,62 @@
 """Example experiments with different sweep strategies and configurations."""
 
+from operator import itemgetter
+from building import Building, BuildingSnapshot
 from simulation import SweepSimulation
-from task1_scenario import create_task1_building, get_task1_starting_positions
+from task1_scenario import create_task1_building, get_task1_template, get_task1_starting_positions
 from responder import Responder, SweepStrategy, ExpertiseLevel
 from visualization import visualize_building_ascii, create_summary_report
 
 
+def _run_task1(template: BuildingSnapshot, expertise1, expertise2, strategy):
+    """Run the Task 1 scenario with two firefighters on separate teams and return the results.
+    
+    The building is restored from the template, so the layout is only built once per experiment.
+    """
+    building = Building.from_snapshot(template)
+    
+    firefighter1 = Responder(
+        responder_id="FF1",
+        name="Firefighter 1",
+        strategy=strategy,
+        expertise=expertise1,
+        team_id=1
+    )
+    
+    firefighter2 = Responder(
+        responder_id="FF2",
+        name="Firefighter 2",
+        strategy=strategy,
+        expertise=expertise2,
+        team_id=2
+    )
+    
+    simulation = SweepSimulation(building, [firefighter1, firefighter2])
+    simulation.assign_starting_positions(get_task1_starting_positions())
+    return simulation.run_simulation()
+
+
+def _run_one_strategy(template, strategy):
+    """Worker for experiment_different_strategies."""
+    results = _run_task1(template, ExpertiseLevel.INTERMEDIATE, ExpertiseLevel.INTERMEDIATE, strategy)
+    return {
+        'strategy': strategy.value,
+        'time': results['completion_time'],
+        'time_minutes': results['completion_time_minutes']
+    }
+
+
+def _run_one_expertise(template, config):
+    """Worker for experiment_expertise_levels."""
+    exp1, exp2, name = config
+    results = _run_task1(template, exp1, exp2, SweepStrategy.NEAREST_FIRST)
+    return {
+        'config': name,
+        'time': results['completion_time'],
+        'time_minutes': results['completion_time_minutes']
+    }
+
+
 def experiment_different_strategies():
     """Compare different sweep strategies."""
     print("\n" + "=" * 70)
@@ -18,44 +69,14 @@ def experiment_different_strategies():
         SweepStrategy.SYSTEMATIC
     ]
     
-    results_comparison = []
-    
-    for strategy in strategies:
-        print(f"\n📊 Testing {strategy.value} strategy...")
-        
-        # Create building and responders
-        building = create_task1_building()
-        
-        firefighter1 = Responder(
-            responder_id="FF1",
-            name="Firefighter 1",
-            strategy=strategy,
-            expertise=ExpertiseLevel.INTERMEDIATE,
-            team_id=1
-        )
-        
-        firefighter2 = Responder(
-            responder_id="FF2",
-            name="Firefighter 2",
-            strategy=strategy,
-            expertise=ExpertiseLevel.INTERMEDIATE,
-            team_id=2
-        )
-        
-        responders = [firefighter1, firefighter2]
-        
-        # Run simulation
-        simulation = SweepSimulation(building, responders)
-        simulation.assign_starting_positions(get_task1_starting_positions())
-        results = simulation.run_simulation()
-        
-        results_comparison.append({
-            'strategy': strategy.value,
-            'time': results['completion_time'],
-            'time_minutes': results['completion_time_minutes']
-        })
-        
-        print(f"   Completion time: {results['completion_time']:.1f}s ({results['completion_time_minutes']:.2f}min)")
+    # Every run starts from a fresh copy of the same layout template
+    template = get_task1_template()
+    
+    results_comparison = [_run_one_strategy(template, strategy) for strategy in strategies]
+    
+    for r in results_comparison:
+        print(f"\n📊 Testing {r['strategy']} strategy...")
+        print(f"   Completion time: {r['time']:.1f}s ({r['time_minutes']:.2f}min)")
     
     print("\n" + "=" * 70)
     print("RESULTS COMPARISON")
@@ -63,7 +84,7 @@ def experiment_different_strategies():
     for r in results_comparison:
         print(f"  {r['strategy']:20s}: {r['time']:6.1f}s ({r['time_minutes']:.2f}min)")
     
-    best = min(results_comparison, key=lambda x: x['time'])
+    best = min(results_comparison, key=itemgetter('time'))
     print(f"\n🏆 Best strategy: {best['strategy']} ({best['time']:.1f}s)")
     print("=" * 70)
 
@@ -81,44 +102,13 @@ def experiment_expertise_levels():
         (ExpertiseLevel.EXPERT, ExpertiseLevel.NOVICE, "Expert + Novice"),
     ]
     
-    results_comparison = []
-    
-    for exp1, exp2, name in expertise_configs:
-        print(f"\n📊 Testing {name}...")
-        
-        # Create building and responders
-        building = create_task1_building()
-        
-        firefighter1 = Responder(
-            responder_id="FF1",
-            name="Firefighter 1",
-            strategy=SweepStrategy.NEAREST_FIRST,
-            expertise=exp1,
-            team_id=1
-        )
-        
-        firefighter2 = Responder(
-            responder_id="FF2",
-            name="Firefighter 2",
-            strategy=SweepStrategy.NEAREST_FIRST,
-            expertise=exp2,
-            team_id=2
-        )
-        
-        responders = [firefighter1, firefighter2]
-        
-        # Run simulation
-        simulation = SweepSimulation(building, responders)
-        simulation.assign_starting_positions(get_task1_starting_positions())
-        results = simulation.run_simulation()
-        
-        results_comparison.append({
-            'config': name,
-            'time': results['completion_time'],
-            'time_minutes': results['completion_time_minutes']
-        })
-        
-        print(f"   Completion time: {results['completion_time']:.1f}s ({results['completion_time_minutes']:.2f}min)")
+    template = get_task1_template()
+    
+    results_comparison = [_run_one_expertise(template, config) for config in expertise_configs]
+    
+    for r in results_comparison:
+        print(f"\n📊 Testing {r['config']}...")
+        print(f"   Completion time: {r['time']:.1f}s ({r['time_minutes']:.2f}min)")
     
     print("\n" + "=" * 70)
     print("RESULTS COMPARISON")
@@ -126,7 +116,7 @@ def experiment_expertise_levels():
     for r in results_comparison:
         print(f"  {r['config']:20s}: {r['time']:6.1f}s ({r['time_minutes']:.2f}min)")
     
-    best = min(results_comparison, key=lambda x: x['time'])
+    best = min(results_comparison, key=itemgetter('time'))
     print(f"\n🏆 Best configuration: {best['config']} ({best['time']:.1f}s)")
     print("=" * 70)
 
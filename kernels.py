@@ -0,0 +1,283 @@
+"""Numeric kernels for the building sweep simulation.
+
+Every kernel is a plain Python function. The array kernels (dijkstra and
+batch_sweep_duration) only use plain NumPy arrays so they can also be
+compiled with Numba, which is optional (the ``fast`` extra). Numba is
+imported by compiled_kernels() on first use rather than here, and callers
+only ask for compiled kernels on inputs of at least MIN_COMPILED_SIZE
+rooms: below that, loading the compiled code costs more than it saves.
+
+pick_nearest and the per-room scalar formulas (priority_score,
+sweep_duration and sweep_duration_plain) are never compiled: they are
+called once per decision or room, and calling a compiled function from
+Python costs more in dispatch than the little work each call does.
+"""
+
+from functools import lru_cache
+from importlib.util import find_spec
+from types import FunctionType, SimpleNamespace
+
+import numpy as np
+
+HAVE_NUMBA = find_spec("numba") is not None
+
+# Fewest rooms for which the compiled kernels pay for loading them
+MIN_COMPILED_SIZE = 256
+
+# batch_sweep_duration loops with prange; compiled copies use numba.prange
+prange = range
+
+
+def _heap_push(keys, vals, size, key, val):
+    """Push (key, val) onto a binary min-heap stored in two flat arrays."""
+    i = size
+    keys[i] = key
+    vals[i] = val
+    while i > 0:
+        parent = (i - 1) // 2
+        if keys[parent] <= keys[i]:
+            break
+        keys[parent], keys[i] = keys[i], keys[parent]
+        vals[parent], vals[i] = vals[i], vals[parent]
+        i = parent
+    return size + 1
+
+
+def _heap_pop(keys, vals, size):
+    """Pop the smallest entry; returns (key, val, new_size)."""
+    key = keys[0]
+    val = vals[0]
+    size -= 1
+    keys[0] = keys[size]
+    vals[0] = vals[size]
+    i = 0
+    while True:
+        left = 2 * i + 1
+        if left >= size:
+            break
+        child = left
+        if left + 1 < size and keys[left + 1] < keys[left]:
+            child = left + 1
+        if keys[i] <= keys[child]:
+            break
+        keys[child], keys[i] = keys[i], keys[child]
+        vals[child], vals[i] = vals[i], vals[child]
+        i = child
+    return key, val, size
+
+
+def dijkstra(indptr, indices, weights, source, target=-1):
+    """
+    Single-source Dijkstra over a CSR graph.
+
+    Args:
+        indptr, indices, weights: CSR adjacency arrays
+        source: Row index to start from
+        target: Optional row index; the search stops once it is settled (-1 = run to completion)
+
+    Returns:
+        Tuple (dist, prev): dist[i] is the distance from source (inf if
+        unreachable) and prev[i] is the previous row on a shortest path
+        (-1 for the source and unreachable rows)
+    """
+    n = indptr.shape[0] - 1
+    dist = np.full(n, np.inf)
+    prev = np.full(n, -1, dtype=np.int64)
+    done = np.zeros(n, dtype=np.bool_)
+    # Lazy-deletion heap: at most one push per edge relaxation plus the source
+    keys = np.empty(indices.shape[0] + 1, dtype=np.float64)
+    vals = np.empty(indices.shape[0] + 1, dtype=np.int64)
+    dist[source] = 0.0
+    size = _heap_push(keys, vals, 0, 0.0, source)
+    while size > 0:
+        d, u, size = _heap_pop(keys, vals, size)
+        if done[u]:
+            continue
+        done[u] = True
+        if u == target:
+            break
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            nd = d + weights[k]
+            if nd < dist[v]:
+                dist[v] = nd
+                prev[v] = u
+                size = _heap_push(keys, vals, size, nd, v)
+    return dist, prev
+
+
+def pick_nearest(distances, priorities, id_ranks):
+    """
+    Index of the best nearest-first candidate.
+
+    Candidates are scored priority * 1000 - distance; ties go to the
+    candidate with the highest room ID rank.
+
+    Args:
+        distances: Distance from the responder to each candidate
+        priorities: Priority level of each candidate
+        id_ranks: Rank of each candidate's room ID in sorted order
+
+    Returns:
+        Position of the chosen candidate (-1 if there are none)
+    """
+    best = -1
+    best_score = -np.inf
+    best_rank = -1
+    for i, (distance, priority, rank) in enumerate(zip(distances.tolist(), priorities.tolist(), id_ranks.tolist())):
+        score = priority * 1000 - distance
+        if score > best_score or (score == best_score and rank > best_rank):
+            best = i
+            best_score = score
+            best_rank = rank
+    return best
+
+
+def priority_score(has_smoke, is_visible, expected_occupants, distance, emergency_bonus):
+    """
+    Priority score for one room (higher = sweep sooner); see Responder.get_priority_score.
+
+    Args:
+        has_smoke: Whether the room has smoke
+        is_visible: Whether the room is visible
+        expected_occupants: Expected number of occupants
+        distance: Distance from the responder to the room
+        emergency_bonus: Emergency-specific priority bonus
+
+    Returns:
+        Priority score
+    """
+    score = 0.0 + emergency_bonus
+    if has_smoke:
+        score += 150
+    if not is_visible:
+        score += 100
+    score += expected_occupants * 10
+    if distance > 0:
+        score += 50 / distance
+    return score
+
+
+def sweep_duration(area, visible_fraction, type_mult, occ_mult, is_visible, expected_occupants,
+                   T, vis_mult, occ_resp_mult, diff_mult, expertise):
+    """
+    Sweep time for one room; see Room.calculate_sweep_duration.
+
+    Emergency multipliers are passed as 1.0 when there is no emergency.
+
+    Args:
+        area: Room area in square meters
+        visible_fraction: Fraction of floor area that is visible
+        type_mult, occ_mult: Room-type and occupant-type multipliers
+        is_visible: Whether the room has good visibility
+        expected_occupants: Expected number of occupants
+        T: Baseline time per square meter
+        vis_mult, occ_resp_mult, diff_mult: Emergency visibility, occupant-response and difficulty multipliers
+        expertise: Responder expertise multiplier (higher is faster)
+
+    Returns:
+        Time in seconds to sweep the room
+    """
+    r = max(0.0, min(1.0, visible_fraction))
+    # C = 5 for r <= 0.2, minus one for each of 0.2/0.4/0.6/0.8 that r exceeds
+    clutter_C = 5 - (r > 0.2) - (r > 0.4) - (r > 0.6) - (r > 0.8)
+    base_time = T * area * clutter_C
+    base_time *= type_mult
+    base_time *= occ_mult
+    base_time *= vis_mult
+    if expected_occupants > 0:
+        base_time *= occ_resp_mult
+    base_time *= diff_mult
+    if not is_visible:
+        base_time *= min(3.0, 1.0 + (0.8 - r))
+    if visible_fraction >= 0.9 and expected_occupants == 0:
+        base_time /= 5.0
+    return base_time / expertise
+
+
+def batch_sweep_duration(areas, visible_fractions, type_mults, occ_mults, is_visible, expected_occupants,
+                         T, vis_mult, occ_resp_mult, diff_mult, expertise):
+    """
+    sweep_duration for many rooms, spread across cores with prange.
+
+    Args:
+        areas, visible_fractions, type_mults, occ_mults, is_visible, expected_occupants:
+            Per-room arrays, as for sweep_duration
+        T, vis_mult, occ_resp_mult, diff_mult, expertise: Scalars shared by every room
+
+    Returns:
+        Array of sweep times in seconds, one per room
+    """
+    n = areas.shape[0]
+    out = np.empty(n)
+    for i in prange(n):
+        out[i] = sweep_duration(areas[i], visible_fractions[i], type_mults[i], occ_mults[i],
+                                is_visible[i], expected_occupants[i],
+                                T, vis_mult, occ_resp_mult, diff_mult, expertise)
+    return out
+
+
+def sweep_duration_plain(area, visible_fraction, type_mult, occ_mult, is_visible, expected_occupants,
+                         T, expertise):
+    """
+    sweep_duration specialized for normal conditions (no emergency).
+
+    Skips the three emergency multipliers, which are all 1.0 without an
+    emergency, so the result is identical to sweep_duration.
+
+    Args:
+        area: Room area in square meters
+        visible_fraction: Fraction of floor area that is visible
+        type_mult, occ_mult: Room-type and occupant-type multipliers
+        is_visible: Whether the room has good visibility
+        expected_occupants: Expected number of occupants
+        T: Baseline time per square meter
+        expertise: Responder expertise multiplier (higher is faster)
+
+    Returns:
+        Time in seconds to sweep the room
+    """
+    if is_visible and visible_fraction >= 0.9 and expected_occupants == 0:
+        # Quick sweep of an empty, clearly visible room: clutter C is 1 and
+        # there is no visibility penalty
+        return T * area * type_mult * occ_mult / 5.0 / expertise
+    r = max(0.0, min(1.0, visible_fraction))
+    clutter_C = 5 - (r > 0.2) - (r > 0.4) - (r > 0.6) - (r > 0.8)
+    base_time = T * area * clutter_C
+    base_time *= type_mult
+    base_time *= occ_mult
+    if not is_visible:
+        base_time *= min(3.0, 1.0 + (0.8 - r))
+    if visible_fraction >= 0.9 and expected_occupants == 0:
+        base_time /= 5.0
+    return base_time / expertise
+
+
+@lru_cache(maxsize=None)
+def compiled_kernels() -> SimpleNamespace:
+    """
+    Numba-compiled dijkstra and batch_sweep_duration, built on first use.
+    
+    Only call this when HAVE_NUMBA is true. Each kernel is compiled from a
+    copy of the Python function whose globals point at the compiled
+    helpers it calls, so the Python versions stay usable as they are.
+    
+    Returns:
+        Namespace with dijkstra and batch_sweep_duration attributes
+    """
+    import numba
+
+    def jit(func, helpers, **options):
+        namespace = dict(globals(), **helpers)
+        copy = FunctionType(func.__code__, namespace, func.__name__, func.__defaults__)
+        return numba.njit(cache=True, **options)(copy)
+
+    heap = {'_heap_push': jit(_heap_push, {}), '_heap_pop': jit(_heap_pop, {})}
+    return SimpleNamespace(
+        dijkstra=jit(dijkstra, heap),
+        batch_sweep_duration=jit(
+            batch_sweep_duration,
+            {'sweep_duration': jit(sweep_duration, {}), 'prange': numba.prange},
+            parallel=True,
+        ),
+    )
@@ -2,6 +2,8 @@
 
 from enum import Enum
 from typing import Optional, List, TYPE_CHECKING
+import numpy as np
+from kernels import priority_score
 from room import Room
 
 if TYPE_CHECKING:
@@ -24,9 +26,48 @@ class ExpertiseLevel(Enum):
     VETERAN = 1.5  # Very fast and efficient
 
 
+def score_rooms_batch(
+    has_smoke: np.ndarray,
+    is_visible: np.ndarray,
+    expected_occupants: np.ndarray,
+    distances: np.ndarray,
+    emergency_bonus: float = 0.0,
+) -> np.ndarray:
+    """
+    Vectorized form of Responder.get_priority_score over many rooms.
+    
+    Terms are added in the same order as the scalar version so scores match
+    it exactly.
+    
+    Args:
+        has_smoke: Whether each room has smoke
+        is_visible: Whether each room is visible
+        expected_occupants: Expected occupants per room
+        distances: Distance from the responder to each room
+        emergency_bonus: Emergency priority bonus added to every room
+        
+    Returns:
+        Array of priority scores
+    """
+    score = emergency_bonus + 150.0 * has_smoke
+    score = score + 100.0 * ~is_visible
+    score = score + expected_occupants * 10
+    with np.errstate(divide='ignore'):
+        score = score + np.where(distances > 0, 50 / distances, 0.0)
+    return score
+
+
 class Responder:
     """Represents a firefighter or emergency responder."""
     
+    __slots__ = (
+        'responder_id', 'name', 'strategy', 'expertise',
+        'base_movement_speed', 'movement_speed', 'team_id', 'team_id_str', 'emergency_context',
+        'current_room_id', '_rooms_swept', '_rooms_checked', '_swept_count', '_checked_count',
+        'total_distance_traveled', 'total_sweep_time', 'current_time', 'is_available',
+        '_expertise_mult', '_priority_bonus', 'track_stats',
+    )
+    
     def __init__(
         self,
         responder_id: str,
@@ -36,6 +77,7 @@ class Responder:
         movement_speed: float = 3.0,  # meters per second (updated default)
         team_id: Optional[int] = None,
         emergency_context: Optional['EmergencyContext'] = None,
+        track_stats: bool = True,
     ):
         """
         Initialize a Responder.
@@ -48,46 +90,62 @@ class Responder:
             movement_speed: Speed of movement in meters per second
             team_id: Team identifier (e.g., 1 for team A, 2 for team B)
             emergency_context: Emergency conditions affecting operations
+            track_stats: Record distance traveled and room ID logs (counts and times are always kept)
         """
         self.responder_id = responder_id
         self.name = name
         self.strategy = strategy
         self.expertise = expertise
         self.base_movement_speed = movement_speed  # Store base speed
-        self.movement_speed = movement_speed
         self.team_id = team_id
-        self.emergency_context = emergency_context
-        
-        # Apply emergency speed reduction if applicable
-        if self.emergency_context:
-            self.movement_speed = self.base_movement_speed * self.emergency_context.get_movement_speed_multiplier()
+        # Key recorded in room sweep histories for this responder's team
+        self.team_id_str = str(team_id) if team_id else responder_id
+        self.track_stats = track_stats
+        self._expertise_mult = float(expertise.value)
+        # Sets emergency_context, movement_speed and the cached priority bonus
+        self.set_emergency_context(emergency_context)
         
         # State tracking
         self.current_room_id: Optional[str] = None
-        self.rooms_swept: List[str] = []
-        self.rooms_checked: List[str] = []
+        # Room ID logs (only filled when track_stats is on); the counts are always kept
+        self._rooms_swept: List[str] = []
+        self._rooms_checked: List[str] = []
+        self._swept_count = 0
+        self._checked_count = 0
         self.total_distance_traveled: float = 0.0
         self.total_sweep_time: float = 0.0
         self.current_time: float = 0.0
         self.is_available: bool = True  # Whether responder is available for next task
         
-    def set_emergency_context(self, emergency_context: 'EmergencyContext'):
+    @property
+    def rooms_swept(self) -> List[str]:
+        """IDs of the rooms swept so far, in order (empty when track_stats is off)."""
+        return list(self._rooms_swept)
+    
+    @property
+    def rooms_checked(self) -> List[str]:
+        """IDs of the rooms checked so far, in order (empty when track_stats is off)."""
+        return list(self._rooms_checked)
+    
+    def set_emergency_context(self, emergency_context: Optional['EmergencyContext']):
         """
         Set or update the emergency context.
         
         Args:
-            emergency_context: New emergency conditions
+            emergency_context: New emergency conditions (None = normal conditions)
         """
         self.emergency_context = emergency_context
-        # Recalculate movement speed
-        if self.emergency_context:
-            self.movement_speed = self.base_movement_speed * self.emergency_context.get_movement_speed_multiplier()
+        # Recalculate movement speed and priority bonus from the context's precomputed values
+        if emergency_context:
+            self.movement_speed = self.base_movement_speed * emergency_context.get_movement_speed_multiplier()
+            self._priority_bonus = emergency_context.get_priority_bonus()
         else:
             self.movement_speed = self.base_movement_speed
+            self._priority_bonus = 0.0
         
     def get_expertise_multiplier(self) -> float:
         """Get the expertise multiplier for sweep duration calculation."""
-        return self.expertise.value
+        return self._expertise_mult
     
     def calculate_travel_time(self, distance: float) -> float:
         """
@@ -110,10 +168,10 @@ class Responder:
             distance: Distance to travel
             current_time: Current simulation time
         """
-        travel_time = self.calculate_travel_time(distance)
         self.current_room_id = room_id
-        self.total_distance_traveled += distance
-        self.current_time = current_time + travel_time
+        if self.track_stats:
+            self.total_distance_traveled += distance
+        self.current_time = current_time + distance / self.movement_speed
         
     def sweep_room(self, room: Room) -> float:
         """
@@ -130,7 +188,9 @@ class Responder:
             emergency_context=self.emergency_context
         )
         self.total_sweep_time += sweep_duration
-        self.rooms_swept.append(room.room_id)
+        if self.track_stats:
+            self._rooms_swept.append(room.room_id)
+        self._swept_count += 1
         room.mark_swept(self.current_time + sweep_duration, team_id=self.team_id)
         self.current_time += sweep_duration
         return sweep_duration
@@ -150,7 +210,9 @@ class Responder:
             self.get_expertise_multiplier(),
             emergency_context=self.emergency_context
         ) * 0.1
-        self.rooms_checked.append(room.room_id)
+        if self.track_stats:
+            self._rooms_checked.append(room.room_id)
+        self._checked_count += 1
         room.mark_checked(self.current_time + check_duration, team_id=self.team_id)
         self.current_time += check_duration
         # Return whether re-sweep is needed
@@ -168,34 +230,28 @@ class Responder:
         Returns:
             Priority score
         """
-        score = 0.0
-        
-        # Add emergency-specific priority bonus
-        if self.emergency_context:
-            score += self.emergency_context.get_priority_bonus()
-        
-        # Prioritize rooms with smoke (highest priority)
-        if room.has_smoke:
-            score += 150
-        
-        # Prioritize rooms with poor visibility (smoke/darkness)
-        if not room.is_visible:
-            score += 100
-            
-        # Prioritize rooms with occupants
-        score += room.expected_occupants * 10
-        
-        # Prefer closer rooms (inverse of distance)
-        if distance > 0:
-            score += 50 / distance
-            
-        return score
+        # Emergency bonus, then smoke (+150), poor visibility (+100),
+        # occupants (+10 each) and closeness (+50/distance)
+        return priority_score(room.has_smoke, room.is_visible, float(room.expected_occupants),
+                              distance, self._priority_bonus)
+    
+    def get_priority_scores(
+        self,
+        has_smoke: np.ndarray,
+        is_visible: np.ndarray,
+        expected_occupants: np.ndarray,
+        distances: np.ndarray,
+    ) -> np.ndarray:
+        """Score many rooms at once; see score_rooms_batch and get_priority_score."""
+        return score_rooms_batch(has_smoke, is_visible, expected_occupants, distances, self._priority_bonus)
     
     def reset(self):
         """Reset responder state for a new simulation."""
         self.current_room_id = None
-        self.rooms_swept = []
-        self.rooms_checked = []
+        self._rooms_swept = []
+        self._rooms_checked = []
+        self._swept_count = 0
+        self._checked_count = 0
         self.total_distance_traveled = 0.0
         self.total_sweep_time = 0.0
         self.current_time = 0.0
@@ -207,8 +263,8 @@ class Responder:
             'responder_id': self.responder_id,
             'name': self.name,
             'team_id': self.team_id,
-            'rooms_swept': len(self.rooms_swept),
-            'rooms_checked': len(self.rooms_checked),
+            'rooms_swept': self._swept_count,
+            'rooms_checked': self._checked_count,
             'total_distance': round(self.total_distance_traveled, 2),
             'total_sweep_time': round(self.total_sweep_time, 2),
             'total_time': round(self.current_time, 2),
@@ -220,4 +276,4 @@ class Responder:
         """String representation of the responder."""
         team_str = f", team {self.team_id}" if self.team_id else ""
         return (f"Responder({self.name}, {self.expertise.name}{team_str}, "
-                f"swept {len(self.rooms_swept)} rooms, checked {len(self.rooms_checked)})")
+                f"swept {self._swept_count} rooms, checked {self._checked_count})")
@@ -1,7 +1,12 @@
 """Room module for building sweep simulation."""
 
+from collections import namedtuple
 from enum import Enum
-from typing import Optional, TYPE_CHECKING
+from functools import lru_cache
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Optional, Tuple, TYPE_CHECKING
+from kernels import sweep_duration, sweep_duration_plain
 
 if TYPE_CHECKING:
     from emergency import EmergencyContext
@@ -80,6 +85,16 @@ ROOM_PRIORITY_LEVELS = {
 }
 
 
+def _sweeps_for_priority(priority: int) -> int:
+    """Number of full sweeps required at a given priority level."""
+    if priority >= 5:
+        return 3  # Critical rooms need 3 full sweeps
+    elif priority >= 4:
+        return 2  # High priority needs 2 full sweeps
+    else:
+        return 1  # All others need 1 sweep (+ check for priority 2-3)
+
+
 def get_required_sweeps(room_type: RoomType, priority_override: Optional[int] = None) -> int:
     """
     Get the number of required sweeps for a room based on its priority level.
@@ -98,14 +113,10 @@ def get_required_sweeps(room_type: RoomType, priority_override: Optional[int] =
         2 (Low): 1 sweep (+ 1 check by different team)
         1 (Minimal): 1 sweep (no check required)
     """
-    priority = priority_override if priority_override is not None else ROOM_PRIORITY_LEVELS.get(room_type, 3)
-    
-    if priority >= 5:
-        return 3  # Critical rooms need 3 full sweeps
-    elif priority >= 4:
-        return 2  # High priority needs 2 full sweeps
-    else:
-        return 1  # All others need 1 sweep (+ check for priority 2-3)
+    if priority_override is not None:
+        return _sweeps_for_priority(priority_override)
+    info = ROOM_TYPE_INFO.get(room_type)
+    return info.required_sweeps if info else 1  # Unknown types default to priority 3
 
 
 def requires_check(room_type: RoomType, priority_override: Optional[int] = None) -> bool:
@@ -122,8 +133,10 @@ def requires_check(room_type: RoomType, priority_override: Optional[int] = None)
     Returns:
         True if room requires check, False otherwise
     """
-    priority = priority_override if priority_override is not None else ROOM_PRIORITY_LEVELS.get(room_type, 3)
-    return priority >= 2
+    if priority_override is not None:
+        return priority_override >= 2
+    info = ROOM_TYPE_INFO.get(room_type)
+    return info.requires_check if info else True  # Unknown types default to priority 3
 
 
 class OccupantType(Enum):
@@ -134,9 +147,121 @@ class OccupantType(Enum):
     HIGH_DENSITY = "high_density"  # Many people
 
 
+# Sweep-time multipliers by room type and occupant type (missing types use 1.0).
+# Read-only: the per-index tables below and each Room's cached multipliers are
+# derived from them.
+ROOM_TYPE_SWEEP_MULTIPLIERS = MappingProxyType({
+    RoomType.OFFICE: 1.2,  # More places to check
+    RoomType.CONFERENCE: 1.0,  # Open layout
+    RoomType.STORAGE: 1.5,  # Cluttered
+    RoomType.RESTROOM: 0.8,  # Small, simple
+    RoomType.HALLWAY: 0.5,  # Quick visual sweep
+    RoomType.EXIT: 0.1,  # Just need to check
+})
+
+OCCUPANT_SWEEP_MULTIPLIERS = MappingProxyType({
+    OccupantType.NONE: 0.8,
+    OccupantType.LOW_MOBILITY: 1.5,  # Need extra care
+    OccupantType.NORMAL: 1.0,
+    OccupantType.HIGH_DENSITY: 1.3,  # More people to check
+})
+
+# Enum members in definition order; a room's type index is its position here
+ROOM_TYPES = tuple(RoomType)
+OCCUPANT_TYPES = tuple(OccupantType)
+ROOM_TYPE_INDEX = {room_type: i for i, room_type in enumerate(ROOM_TYPES)}
+OCCUPANT_TYPE_INDEX = {occupant_type: i for i, occupant_type in enumerate(OCCUPANT_TYPES)}
+
+# Sweep multipliers indexed by type index
+TYPE_MULTS = tuple(ROOM_TYPE_SWEEP_MULTIPLIERS.get(t, 1.0) for t in ROOM_TYPES)
+OCC_MULTS = tuple(OCCUPANT_SWEEP_MULTIPLIERS.get(t, 1.0) for t in OCCUPANT_TYPES)
+
+# Everything about a room that follows from its type alone (ignoring any
+# priority override). One shared instance per RoomType.
+RoomTypeInfo = namedtuple(
+    'RoomTypeInfo',
+    'priority_level required_sweeps requires_check type_mult rtype_idx'
+)
+
+
+def _room_type_info(idx: int, room_type: RoomType) -> RoomTypeInfo:
+    """Build the RoomTypeInfo for the room type at position idx of ROOM_TYPES."""
+    priority = ROOM_PRIORITY_LEVELS.get(room_type, 3)  # Unlisted types default to priority 3
+    return RoomTypeInfo(priority, _sweeps_for_priority(priority), priority >= 2, TYPE_MULTS[idx], idx)
+
+
+ROOM_TYPE_INFO = {room_type: _room_type_info(i, room_type) for i, room_type in enumerate(ROOM_TYPES)}
+
+def emergency_factors(emergency_context: Optional['EmergencyContext']) -> Tuple[float, float, float]:
+    """
+    Emergency multipliers used by the sweep-duration calculation.
+    
+    Args:
+        emergency_context: Emergency conditions, or None for normal conditions
+        
+    Returns:
+        Tuple (visibility, occupant response, sweep difficulty) multipliers;
+        all 1.0 when there is no emergency
+    """
+    if emergency_context:
+        return (
+            emergency_context.get_visibility_multiplier(),
+            emergency_context.get_occupant_response_multiplier(),
+            emergency_context.get_sweep_difficulty_multiplier(),
+        )
+    return 1.0, 1.0, 1.0
+
+
+@lru_cache(maxsize=None)
+def _format_sweep_progress(actual: int, required: int) -> str:
+    """Progress string for Room.get_sweep_progress; only a handful of (actual, required) pairs occur."""
+    sweep_word = "sweep" if required == 1 else "sweeps"
+    status = " (complete)" if actual >= required else ""
+    return f"{actual}/{required} {sweep_word}{status}"
+
+
+def _cached_input(name: str, sweep_input: bool, repr_input: bool) -> property:
+    """
+    Room attribute stored in the slot _<name> whose setter drops the caches built from it.
+    
+    The setter also tells the room's attribute listeners (see
+    Room.register_attribute_listener) about the change.
+    
+    Args:
+        name: Public attribute name
+        sweep_input: Whether calculate_sweep_duration reads the attribute
+        repr_input: Whether the attribute appears in the static part of repr(room)
+    """
+    slot = '_' + name
+
+    def fset(self, value):
+        old_value = getattr(self, slot)
+        setattr(self, slot, value)
+        if sweep_input:
+            self._sweep_duration_cache = {}
+            self._base_constant = None
+        if repr_input:
+            self._repr_parts = None
+        self._notify_attribute_listeners(name, old_value)
+
+    return property(attrgetter(slot), fset)
+
+# Most (time per sqm, expertise, emergency context) combinations kept per room
+_SWEEP_DURATION_CACHE_SIZE = 8
+
+
 class Room:
     """Represents a room in a building with various attributes."""
     
+    __slots__ = (
+        '_room_id', '_area', '_room_type', '_occupant_type', '_has_smoke', '_is_visible',
+        '_visible_fraction', 'is_swept', 'is_checked', '_expected_occupants',
+        '_type_info', '_occ_idx', '_occ_mult', '_base_constant',
+        'priority_override', '_priority_level', 'required_sweeps_count',
+        'actual_sweeps_count', '_sweep_times', '_sweep_teams', '_sweeping_team_ids', '_sweep_listeners', '_attribute_listeners', '_sweep_duration_cache',
+        'swept_by_team', 'checked_by_team', 'needs_resweep', 'sweep_time', '_repr_parts',
+    )
+    
     def __init__(
         self,
         room_id: str,
@@ -165,30 +290,50 @@ class Room:
             expected_occupants: Expected number of occupants
             priority_override: Optional manual priority override (1-5), overrides room_type default
         """
-        self.room_id = room_id
-        self.area = area
-        self.room_type = room_type
-        self.occupant_type = occupant_type
-        self.has_smoke = has_smoke
+        # calculate_sweep_duration results keyed by (time per sqm, expertise, emergency context)
+        self._sweep_duration_cache = {}
+        # Expertise-independent sweep time at T = 1 without an emergency, built on first use
+        self._base_constant = None
+        # (prefix, suffix) of repr(room) around the sweep status, built on first use
+        self._repr_parts = None
+        # Fill the slots behind the cached-input properties directly; there
+        # is nothing cached yet to invalidate
+        self._room_id = room_id
+        self._area = area
+        self._room_type = room_type
+        self._type_info = ROOM_TYPE_INFO[room_type]
+        self._occupant_type = occupant_type
+        self._occ_idx = OCCUPANT_TYPE_INDEX[occupant_type]
+        self._occ_mult = OCC_MULTS[self._occ_idx]
+        self._has_smoke = has_smoke
         # If there's smoke, automatically set visibility to False
-        self.is_visible = False if has_smoke else is_visible
+        self._is_visible = False if has_smoke else is_visible
         # Fraction of floor area that is visible (0.0 - 1.0). Used to compute
         # a clutter multiplier. If smoke is present and the caller did not
         # supply a visible_fraction, default to a lower visibility.
-        self.visible_fraction = visible_fraction
-        if self.has_smoke and visible_fraction == 1.0:
+        self._visible_fraction = visible_fraction
+        if has_smoke and visible_fraction == 1.0:
             # default reduced visible area for smoky rooms
-            self.visible_fraction = 0.3
+            self._visible_fraction = 0.3
         self.is_swept = is_swept
         self.is_checked = is_checked
-        self.expected_occupants = expected_occupants
+        self._expected_occupants = expected_occupants
         
         # Priority-based redundancy tracking
         self.priority_override = priority_override
-        self.priority_level = priority_override if priority_override is not None else ROOM_PRIORITY_LEVELS.get(room_type, 3)
-        self.required_sweeps_count = get_required_sweeps(room_type, priority_override)
+        if priority_override is None:
+            self._priority_level = self._type_info.priority_level
+            self.required_sweeps_count = self._type_info.required_sweeps
+        else:
+            self._priority_level = priority_override
+            self.required_sweeps_count = _sweeps_for_priority(priority_override)
         self.actual_sweeps_count = 0
-        self.sweep_history = []  # List of (time, team_id) tuples
+        # Sweep history as parallel lists of times and team IDs
+        self._sweep_times = []
+        self._sweep_teams = []
+        self._sweeping_team_ids = set()  # Team IDs seen in sweep_history
+        self._sweep_listeners = []  # Callbacks fired whenever the sweep state changes
+        self._attribute_listeners = []  # Callbacks fired when a cached-input attribute is assigned
         
         # Team / redundancy tracking (legacy - kept for backward compatibility)
         self.swept_by_team = None  # type: Optional[str]
@@ -196,6 +341,46 @@ class Room:
         self.needs_resweep = False
         self.sweep_time: Optional[float] = None  # Time when room was swept
         
+    # Inputs to calculate_sweep_duration and repr(room); assigning one drops
+    # the cached values built from it
+    room_id = _cached_input('room_id', sweep_input=False, repr_input=True)
+    area = _cached_input('area', sweep_input=True, repr_input=True)
+    has_smoke = _cached_input('has_smoke', sweep_input=True, repr_input=False)
+    is_visible = _cached_input('is_visible', sweep_input=True, repr_input=False)
+    visible_fraction = _cached_input('visible_fraction', sweep_input=True, repr_input=False)
+    expected_occupants = _cached_input('expected_occupants', sweep_input=True, repr_input=False)
+    priority_level = _cached_input('priority_level', sweep_input=False, repr_input=True)
+
+    @property
+    def room_type(self) -> RoomType:
+        """Type of room; setting it also updates the shared type info."""
+        return self._room_type
+
+    @room_type.setter
+    def room_type(self, value: RoomType):
+        old_value = self._room_type
+        self._room_type = value
+        self._type_info = ROOM_TYPE_INFO[value]
+        self._sweep_duration_cache = {}
+        self._base_constant = None
+        self._repr_parts = None
+        self._notify_attribute_listeners('room_type', old_value)
+
+    @property
+    def occupant_type(self) -> OccupantType:
+        """Type of occupants; setting it also updates the occupant index and multiplier."""
+        return self._occupant_type
+
+    @occupant_type.setter
+    def occupant_type(self, value: OccupantType):
+        old_value = self._occupant_type
+        self._occupant_type = value
+        self._occ_idx = OCCUPANT_TYPE_INDEX[value]
+        self._occ_mult = OCC_MULTS[self._occ_idx]
+        self._sweep_duration_cache = {}
+        self._base_constant = None
+        self._notify_attribute_listeners('occupant_type', old_value)
+        
     def calculate_sweep_duration(
         self,
         responder_expertise: float = 1.0,
@@ -215,78 +400,106 @@ class Room:
         """
         # Use override if provided, otherwise use module-level constant
         T = sweep_time_per_sqm if sweep_time_per_sqm is not None else SWEEP_TIME_PER_SQM
-        # Compute clutter multiplier C based on visible floor fraction r =
-        # (visible floor area) / (total area). The user-specified mapping is:
+        # Emergency contexts are immutable and the input properties clear the
+        # cache when a room attribute changes, so the result only depends on these inputs.
+        key = (T, responder_expertise, emergency_context)
+        cache = self._sweep_duration_cache
+        duration = cache.get(key)
+        if duration is None:
+            if len(cache) >= _SWEEP_DURATION_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                del cache[next(iter(cache))]
+            duration = cache[key] = self._compute_sweep_duration(
+                T, responder_expertise, emergency_context
+            )
+        return duration
+
+    def _compute_sweep_duration(
+        self,
+        T: float,
+        responder_expertise: float,
+        emergency_context: Optional['EmergencyContext'],
+    ) -> float:
+        """Uncached body of calculate_sweep_duration (T = time per square meter)."""
+        # Clutter multiplier C from the visible floor fraction r =
+        # (visible floor area) / (total area):
         #   C=1 if r in (0.8, 1]
         #   C=2 if r in (0.6, 0.8]
         #   C=3 if r in (0.4, 0.6]
         #   C=4 if r in (0.2, 0.4]
         #   C=5 if r in [0.0, 0.2]
-        r = max(0.0, min(1.0, self.visible_fraction))
-        if r > 0.8:
-            clutter_C = 1
-        elif r > 0.6:
-            clutter_C = 2
-        elif r > 0.4:
-            clutter_C = 3
-        elif r > 0.2:
-            clutter_C = 4
-        else:
-            clutter_C = 5
+        # Base time is T * A * C, scaled by room-type, occupant-type and
+        # emergency multipliers (occupant response only for occupied rooms),
+        # a poor-visibility penalty of min(3, 1 + (0.8 - r)) for rooms that
+        # are not visible, a 5x quick sweep for empty rooms with r >= 0.9,
+        # and finally divided by responder expertise.
+        if not emergency_context:
+            # Common case: no emergency multipliers to apply
+            if T == 1.0:
+                # Every factor but expertise is fixed for the room; T * area == area
+                # exactly, so dividing the stored product matches the kernel bit for bit
+                base = self._base_constant
+                if base is None:
+                    base = self._base_constant = sweep_duration_plain(
+                        self.area,
+                        self.visible_fraction,
+                        self._type_info.type_mult,
+                        self._occ_mult,
+                        self.is_visible,
+                        self.expected_occupants,
+                        1.0,
+                        1.0,
+                    )
+                return base / responder_expertise
+            return sweep_duration_plain(
+                self.area,
+                self.visible_fraction,
+                self._type_info.type_mult,
+                self._occ_mult,
+                self.is_visible,
+                self.expected_occupants,
+                T,
+                responder_expertise,
+            )
+        vis_mult, occ_resp_mult, diff_mult = emergency_factors(emergency_context)
+        return self.calculate_sweep_duration_fast(responder_expertise, T, vis_mult, occ_resp_mult, diff_mult)
 
-        # Base time uses the requested formula T * A * C
-        base_time = T * self.area * clutter_C
-        
-        # Adjust for room type
-        type_multipliers = {
-            RoomType.OFFICE: 1.2,  # More places to check
-            RoomType.CONFERENCE: 1.0,  # Open layout
-            RoomType.STORAGE: 1.5,  # Cluttered
-            RoomType.RESTROOM: 0.8,  # Small, simple
-            RoomType.HALLWAY: 0.5,  # Quick visual sweep
-            RoomType.EXIT: 0.1,  # Just need to check
-        }
-        base_time *= type_multipliers.get(self.room_type, 1.0)
+    def calculate_sweep_duration_fast(
+        self,
+        responder_expertise: float,
+        T: float,
+        vis_mult: float = 1.0,
+        occ_resp_mult: float = 1.0,
+        diff_mult: float = 1.0,
+    ) -> float:
+        """
+        Uncached sweep duration from pre-fetched emergency multipliers.
         
-        # Adjust for occupant type
-        occupant_multipliers = {
-            OccupantType.NONE: 0.8,
-            OccupantType.LOW_MOBILITY: 1.5,  # Need extra care
-            OccupantType.NORMAL: 1.0,
-            OccupantType.HIGH_DENSITY: 1.3,  # More people to check
-        }
-        base_time *= occupant_multipliers.get(self.occupant_type, 1.0)
+        Use this when sweeping many rooms under one emergency context: call
+        emergency_factors once and pass the result to every room.
         
-        # Apply emergency-specific multipliers
-        if emergency_context:
-            # Visibility impact (smoke reduces visibility)
-            base_time *= emergency_context.get_visibility_multiplier()
-            
-            # Occupant response (unnoticeable emergencies slow down occupant interaction)
-            if self.expected_occupants > 0:
-                base_time *= emergency_context.get_occupant_response_multiplier()
+        Args:
+            responder_expertise: Multiplier based on responder expertise (higher is faster)
+            T: Baseline time per square meter
+            vis_mult, occ_resp_mult, diff_mult: Multipliers from emergency_factors
             
-            # Overall sweep difficulty (emergency type, protective gear, etc.)
-            base_time *= emergency_context.get_sweep_difficulty_multiplier()
-        
-        # Poor visibility (smoke/darkness) can further slow down the sweep.
-        # We treat `is_visible` as a boolean fallback; if a room is marked not
-        # visible, apply an additional penalty proportional to reduced
-        # visibility.
-        if not self.is_visible:
-            # scale by inverse of visible fraction (but cap to avoid extreme values)
-            penalty = min(3.0, 1.0 + (0.8 - r))
-            base_time *= penalty
-
-        # Quick sweep optimization: visible room with no occupants can be
-        # checked faster. We only apply this if visible_fraction is high.
-        if self.visible_fraction >= 0.9 and self.expected_occupants == 0:
-            base_time /= 5.0  # 5x faster (20% of normal time)
-
-        # Apply expertise factor (higher expertise reduces required time)
-        base_time /= responder_expertise
-
-        return base_time
+        Returns:
+            Time in seconds to sweep the room
+        """
+        return sweep_duration(
+            self.area,
+            self.visible_fraction,
+            self._type_info.type_mult,
+            self._occ_mult,
+            self.is_visible,
+            self.expected_occupants,
+            T,
+            vis_mult,
+            occ_resp_mult,
+            diff_mult,
+            responder_expertise,
+        )
+
     def mark_swept(self, time: float, team_id: Optional[str] = None):
         """Mark the room as swept at a specific time by a team.
 
@@ -298,10 +511,13 @@ class Room:
             time: Time when sweep occurred
             team_id: Identifier for the team performing the sweep
         """
+        was_swept, was_fully_swept = self.is_swept, self.is_fully_swept()
         # Add to sweep history for priority tracking
         if team_id:
-            self.sweep_history.append((time, team_id))
-            self.actual_sweeps_count = len(self.sweep_history)
+            self._sweep_times.append(time)
+            self._sweep_teams.append(team_id)
+            self._sweeping_team_ids.add(team_id)
+            self.actual_sweeps_count += 1
         
         # Legacy behavior for backward compatibility
         self.is_swept = True
@@ -311,6 +527,42 @@ class Room:
         # Reset check state after a fresh sweep
         self.checked_by_team = None
         self.needs_resweep = False
+        self._notify_sweep_listeners(was_swept, was_fully_swept, team_id or None)
+
+    def register_sweep_listener(self, callback):
+        """
+        Register a callback invoked after every mark_swept / mark_checked.
+        
+        Args:
+            callback: Callable taking (room, was_swept, was_fully_swept, team_id),
+                where the flags are the is_swept / completion state before the
+                change and team_id is the team recorded in the sweep history
+                (None for checks and untracked sweeps)
+        """
+        self._sweep_listeners.append(callback)
+
+    def _notify_sweep_listeners(self, was_swept: bool, was_fully_swept: bool, team_id=None):
+        """Tell registered listeners that the sweep state has changed."""
+        for callback in self._sweep_listeners:
+            callback(self, was_swept, was_fully_swept, team_id)
+
+    def register_attribute_listener(self, callback):
+        """
+        Register a callback invoked after a cached-input attribute is assigned.
+        
+        Covers room_id, area, room_type, occupant_type, has_smoke, is_visible,
+        visible_fraction, expected_occupants and priority_level.
+        
+        Args:
+            callback: Callable taking (room, name, old_value), where name is
+                the attribute assigned and old_value its previous value
+        """
+        self._attribute_listeners.append(callback)
+
+    def _notify_attribute_listeners(self, name: str, old_value):
+        """Tell registered listeners that an attribute has been assigned."""
+        for callback in self._attribute_listeners:
+            callback(self, name, old_value)
 
     def mark_checked(self, time: float, team_id: Optional[str] = None):
         """Mark the room as checked by a team.
@@ -319,6 +571,7 @@ class Room:
         re-sweep (redundancy rule). Otherwise, the room is considered
         successfully checked.
         """
+        was_swept = self.is_swept
         if team_id:
             self.checked_by_team = team_id
 
@@ -332,6 +585,33 @@ class Room:
         else:
             # Successfully checked by a different team
             self.needs_resweep = False
+        self._notify_sweep_listeners(was_swept, self.is_fully_swept())
+    
+    def reset_sweep_status(self):
+        """Reset the room to its unswept state and clear team tracking."""
+        self.is_swept = False
+        self.is_checked = False
+        self.sweep_time = None
+        self.swept_by_team = None
+        self.checked_by_team = None
+        self.needs_resweep = False
+        # Reset priority tracking
+        self.actual_sweeps_count = 0
+        self._sweep_times = []
+        self._sweep_teams = []
+        self._sweeping_team_ids = set()
+    
+    @property
+    def sweep_history(self) -> list[tuple[float, str]]:
+        """(time, team_id) for each recorded sweep, oldest first."""
+        return list(zip(self._sweep_times, self._sweep_teams))
+    
+    @sweep_history.setter
+    def sweep_history(self, history):
+        """Replace the recorded sweeps; the returned lists are copies, so assign rather than append."""
+        self._sweep_times = [time for time, _ in history]
+        self._sweep_teams = [team_id for _, team_id in history]
+        self._sweeping_team_ids = set(self._sweep_teams)
     
     def is_fully_swept(self) -> bool:
         """
@@ -349,7 +629,7 @@ class Room:
         Returns:
             List of unique team IDs from sweep_history
         """
-        return list(set(team_id for _, team_id in self.sweep_history))
+        return list(self._sweeping_team_ids)
     
     def was_swept_by_team(self, team_id: str) -> bool:
         """
@@ -361,7 +641,7 @@ class Room:
         Returns:
             True if team has swept this room, False otherwise
         """
-        return any(tid == team_id for _, tid in self.sweep_history)
+        return team_id in self._sweeping_team_ids
         
     def get_sweep_progress(self) -> str:
         """
@@ -370,17 +650,18 @@ class Room:
         Returns:
             String like "2/3 sweeps" or "1/1 sweep (complete)"
         """
-        sweep_word = "sweep" if self.required_sweeps_count == 1 else "sweeps"
-        status = " (complete)" if self.is_fully_swept() else ""
-        return f"{self.actual_sweeps_count}/{self.required_sweeps_count} {sweep_word}{status}"
+        return _format_sweep_progress(self.actual_sweeps_count, self.required_sweeps_count)
         
     def __repr__(self) -> str:
         """String representation of the room."""
+        parts = self._repr_parts
+        if parts is None:
+            # Add priority indicator for high-priority rooms
+            suffix = f" [P{self.priority_level}])" if self.priority_level >= 4 else ")"
+            parts = self._repr_parts = (f"Room({self.room_id}, {self.room_type.value}, {self.area}m², ", suffix)
         status = "✓" if self.is_swept else "✗"
-        smoke = "🔥" if self.has_smoke else ""
-        visibility = "🌫️" if not self.is_visible and not self.has_smoke else ""
-        # Add priority indicator for high-priority rooms
-        priority_indicator = ""
-        if self.priority_level >= 4:
-            priority_indicator = f" [P{self.priority_level}]"
-        return f"Room({self.room_id}, {self.room_type.value}, {self.area}m², {status}{smoke}{visibility}{priority_indicator})"
+        if self.has_smoke:
+            status += "🔥"
+        elif not self.is_visible:
+            status += "🌫️"
+        return parts[0] + status + parts[1]
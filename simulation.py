@@ -1,10 +1,36 @@
 """Simulation engine for building sweep operations."""
 
-from typing import List, Dict, Tuple, Optional
+from array import array
+from collections import deque
+from enum import IntEnum
+from typing import Deque, Iterator, List, Dict, Tuple, Optional
 from building import Building
+from kernels import pick_nearest
 from responder import Responder, SweepStrategy
 from room import Room
 import heapq
+import numpy as np
+from bisect import insort
+from operator import itemgetter
+
+
+class EventKind(IntEnum):
+    """Kinds of simulation events; stored as small ints in the event log."""
+    START = 0
+    ARRIVE = 1
+    SWEPT = 2
+    CHECKED = 3
+    RESWEEP_NEEDED = 4
+    RESWEEP = 5
+    
+    @property
+    def label(self) -> str:
+        """Name shown in event listings (e.g. "RESWEEP-NEEDED")."""
+        return EVENT_LABELS[self]
+
+
+# Event label by EventKind value
+EVENT_LABELS = ("START", "ARRIVE", "SWEPT", "CHECKED", "RESWEEP-NEEDED", "RESWEEP")
 
 
 class SweepSimulation:
@@ -20,10 +46,17 @@ class SweepSimulation:
         """
         self.building = building
         self.responders = responders
-        self.events: List[Tuple[float, str, str, str]] = []  # (time, responder, event, room)
+        # Event log as parallel columns; see the events property
+        self._ev_time = array('d')
+        self._ev_resp: List[str] = []
+        self._ev_kind = array('B')  # EventKind values
+        self._ev_room: List[str] = []
+        self._events_swept: List[Tuple[float, str, str, str]] = []  # SWEPT events in time order
         # Track teams for redundancy
         self.teams_by_id: Dict[int, List[Responder]] = self._group_responders_by_team()
-        self.resweep_queue: List[str] = []  # Rooms needing re-sweep
+        # Candidate checkers for rooms swept by each team, in checking order
+        self._checkers_by_team: Dict[int, List[Responder]] = {}
+        self.resweep_queue: Deque[str] = deque()  # Rooms needing re-sweep
         
         # Set emergency context for all responders from building
         for responder in self.responders:
@@ -35,10 +68,38 @@ class SweepSimulation:
         self.building.reset_sweep_status()
         for responder in self.responders:
             responder.reset()
-        self.events = []
-        self.resweep_queue = []
+        self._ev_time = array('d')
+        self._ev_resp = []
+        self._ev_kind = array('B')
+        self._ev_room = []
+        self._events_swept = []
+        self.resweep_queue = deque()
         self.teams_by_id = self._group_responders_by_team()
+        self._checkers_by_team = {}
         
+    @property
+    def events(self) -> List[Tuple[float, str, str, str]]:
+        """Logged events as (time, responder, event, room) tuples, in logging order."""
+        return list(self.iter_events())
+    
+    @property
+    def num_events(self) -> int:
+        """Number of events logged so far."""
+        return len(self._ev_time)
+    
+    def iter_events(self) -> Iterator[Tuple[float, str, str, str]]:
+        """Yield logged events as (time, responder, event, room) tuples, in logging order."""
+        for i in range(len(self._ev_time)):
+            yield self._ev_time[i], self._ev_resp[i], EVENT_LABELS[self._ev_kind[i]], self._ev_room[i]
+    
+    def shortest_distance(self, source: str, target: str) -> float:
+        """Shortest-path distance between two rooms (inf if unreachable or unknown)."""
+        return self.building.get_shortest_path(source, target)[1]
+    
+    def shortest_path(self, source: str, target: str) -> Tuple[List[str], float]:
+        """Shortest path between two rooms as (room IDs, distance); see Building.get_shortest_path."""
+        return self.building.get_shortest_path(source, target)
+    
     def _group_responders_by_team(self) -> Dict[int, List[Responder]]:
         """Group responders by team_id for coordination."""
         teams = {}
@@ -59,12 +120,18 @@ class SweepSimulation:
         Returns:
             An available responder from a different team, or None
         """
-        for team_id, responders in self.teams_by_id.items():
-            if team_id != sweeper_team_id:
-                # Return the first available responder from the other team
-                for r in responders:
-                    if r.is_available:
-                        return r
+        candidates = self._checkers_by_team.get(sweeper_team_id)
+        if candidates is None:
+            # Responders of every other team, teams in teams_by_id order
+            candidates = self._checkers_by_team[sweeper_team_id] = [
+                r for team_id, responders in self.teams_by_id.items()
+                if team_id != sweeper_team_id
+                for r in responders
+            ]
+        # Return the first available responder from another team
+        for r in candidates:
+            if r.is_available:
+                return r
         return None
         
     def assign_starting_positions(self, assignments: Dict[str, str]):
@@ -79,7 +146,7 @@ class SweepSimulation:
                 room_id = assignments[responder.responder_id]
                 responder.current_room_id = room_id
                 responder.current_time = 0.0
-                self.log_event(0.0, responder.name, "START", room_id)
+                self.log_event(0.0, responder.name, EventKind.START, room_id)
                 
     def get_next_room(self, responder: Responder) -> Optional[str]:
         """
@@ -95,16 +162,14 @@ class SweepSimulation:
         Returns:
             Room ID of next room to sweep, or None if all done
         """
-        unswept_rooms = self.building.get_unswept_rooms()
-        if not unswept_rooms:
+        building = self.building
+        if not building.has_unswept_rooms():
             return None
             
         # Filter out rooms already swept by this team (for priority-based redundancy)
-        team_id_str = str(responder.team_id) if responder.team_id else responder.responder_id
-        available_rooms = [
-            room for room in unswept_rooms 
-            if not room.was_swept_by_team(team_id_str)
-        ]
+        available_rooms = building.rooms_in_mask(
+            building.unswept_mask() & ~building.team_swept_mask(responder.team_id_str)
+        )
         
         if not available_rooms:
             return None
@@ -116,41 +181,27 @@ class SweepSimulation:
         strategy = responder.strategy
         
         if strategy == SweepStrategy.NEAREST_FIRST:
-            # Find nearest unswept room, prioritizing higher priority rooms
-            # First, sort by priority level (descending), then by distance
-            candidates = []
-            for room in available_rooms:
-                _, distance = self.building.get_shortest_path(current_room, room.room_id)
-                # Priority: higher priority rooms first, then nearest
-                priority_score = room.priority_level * 1000 - distance
-                candidates.append((priority_score, room.room_id, distance))
-            
-            if candidates:
-                candidates.sort(reverse=True)  # Highest priority_score first
-                return candidates[0][1]  # Return room_id
-            return None
+            # Find nearest unswept room, prioritizing higher priority rooms:
+            # highest priority_level * 1000 - distance, ties to the largest room ID
+            rows = building.row_indices([room.room_id for room in available_rooms])
+            best = pick_nearest(
+                building.distances_from(current_room, rows),
+                building.priority_levels(rows),
+                building.id_ranks(rows),
+            )
+            return available_rooms[best].room_id
             
         elif strategy == SweepStrategy.PRIORITY_BASED:
-            # Find highest priority unswept room
-            max_priority = -float('inf')
-            next_room = None
-            
-            for room in available_rooms:
-                _, distance = self.building.get_shortest_path(current_room, room.room_id)
-                priority = responder.get_priority_score(room, distance)
-                if priority > max_priority:
-                    max_priority = priority
-                    next_room = room.room_id
-                    
-            return next_room
+            # Find highest priority unswept room (first one wins ties)
+            rows = building.row_indices([room.room_id for room in available_rooms])
+            distances = building.distances_from(current_room, rows)
+            scores = responder.get_priority_scores(*building.priority_features(rows), distances)
+            return available_rooms[int(np.argmax(scores))].room_id
             
         elif strategy == SweepStrategy.SYSTEMATIC:
             # Sweep rooms in order of priority first, then by room ID
-            sorted_rooms = sorted(
-                available_rooms,
-                key=lambda r: (-r.priority_level, r.room_id)
-            )
-            return sorted_rooms[0].room_id if sorted_rooms else None
+            best = min(available_rooms, key=lambda r: (-r.priority_level, r.room_id))
+            return best.room_id
             
         else:
             # Default to nearest first with priority weighting
@@ -158,17 +209,15 @@ class SweepSimulation:
             
     def get_next_room_nearest(self, responder: Responder, unswept_rooms: List[Room]) -> Optional[str]:
         """Helper method to find nearest unswept room."""
-        current_room = responder.current_room_id
-        min_distance = float('inf')
-        next_room = None
-        
-        for room in unswept_rooms:
-            _, distance = self.building.get_shortest_path(current_room, room.room_id)
-            if distance < min_distance:
-                min_distance = distance
-                next_room = room.room_id
-                
-        return next_room
+        if not unswept_rooms:
+            return None
+        building = self.building
+        distances = building.distances_from(
+            responder.current_room_id, building.row_indices([room.room_id for room in unswept_rooms])
+        )
+        # First room at the smallest distance; None if none is reachable
+        best = int(np.argmin(distances))
+        return unswept_rooms[best].room_id if distances[best] < np.inf else None
     
     def simulate_step(self, responder: Responder) -> bool:
         """
@@ -193,15 +242,15 @@ class SweepSimulation:
             return False
             
         # Move to room
-        travel_time = responder.calculate_travel_time(distance)
-        responder.total_distance_traveled += distance
-        responder.current_time += travel_time
+        if responder.track_stats:
+            responder.total_distance_traveled += distance
+        responder.current_time += distance / responder.movement_speed
         responder.current_room_id = next_room_id
         
         self.log_event(
             responder.current_time,
             responder.name,
-            "ARRIVE",
+            EventKind.ARRIVE,
             next_room_id
         )
         
@@ -209,7 +258,7 @@ class SweepSimulation:
         room = self.building.get_room(next_room_id)
         if room and not room.is_fully_swept():
             # Check if this team has already swept this room
-            team_id_str = str(responder.team_id) if responder.team_id else responder.responder_id
+            team_id_str = responder.team_id_str
             if not room.was_swept_by_team(team_id_str):
                 sweep_duration = responder.sweep_room(room)
                 # Mark room as swept by this team
@@ -217,7 +266,7 @@ class SweepSimulation:
                 self.log_event(
                     responder.current_time,
                     responder.name,
-                    "SWEPT",
+                    EventKind.SWEPT,
                     next_room_id
                 )
             
@@ -234,7 +283,9 @@ class SweepSimulation:
             max_iterations: Maximum number of iterations to prevent infinite loops
             
         Returns:
-            Dictionary with simulation results
+            Dictionary with simulation results. 'events' is always None so the
+            log is not copied; read it with iter_events(), num_events or the
+            events property. 'events_swept' holds the SWEPT events in time order.
         """
         iteration = 0
         resweep_count = 0
@@ -243,17 +294,17 @@ class SweepSimulation:
             # Phase 1: Sweep unswept rooms
             any_action = False
             for responder in self.responders:
-                if self.building.has_unswept_rooms():
-                    if self.simulate_step(responder):
-                        any_action = True
+                # Once every room is swept the remaining responders have nothing to do
+                if not self.building.has_unswept_rooms():
+                    break
+                if self.simulate_step(responder):
+                    any_action = True
             
-            # Phase 2: Check swept but unchecked rooms (with different teams)
-            rooms_to_check = [
-                room for room in self.building.get_all_rooms()
-                if room.is_swept and room.checked_by_team is None
-            ]
+            # Phase 2: Check swept but unchecked rooms (with different teams),
+            # up to 5 rooms per iteration
+            rooms_to_check = self.building.rooms_in_mask(self.building.needs_check_mask(), limit=5)
             
-            for room in rooms_to_check[:5]:  # Check up to 5 rooms per iteration
+            for room in rooms_to_check:
                 checker = self._get_checker_from_different_team(room.swept_by_team or 1)
                 if checker and room.swept_by_team:
                     # Move checker to room (simplified - instant)
@@ -262,7 +313,7 @@ class SweepSimulation:
                     self.log_event(
                         checker.current_time,
                         checker.name,
-                        "CHECKED",
+                        EventKind.CHECKED,
                         room.room_id
                     )
                     if needs_resweep:
@@ -271,14 +322,14 @@ class SweepSimulation:
                         self.log_event(
                             checker.current_time,
                             checker.name,
-                            "RESWEEP-NEEDED",
+                            EventKind.RESWEEP_NEEDED,
                             room.room_id
                         )
                     any_action = True
             
             # Phase 3: Re-sweep rooms that need it
             if self.resweep_queue:
-                room_to_resweep = self.resweep_queue.pop(0)
+                room_to_resweep = self.resweep_queue.popleft()
                 room = self.building.get_room(room_to_resweep)
                 if room:
                     for responder in self.responders:
@@ -288,7 +339,7 @@ class SweepSimulation:
                             self.log_event(
                                 responder.current_time,
                                 responder.name,
-                                "RESWEEP",
+                                EventKind.RESWEEP,
                                 room_to_resweep
                             )
                             any_action = True
@@ -311,14 +362,34 @@ class SweepSimulation:
             'responder_stats': [r.get_stats() for r in self.responders],
             'iterations': iteration,
             'resweep_count': resweep_count,
-            'events': self.events
+            'events': None,  # use iter_events() / num_events; avoids copying the log
+            'events_swept': self._events_swept,
         }
         
         return results
     
-    def log_event(self, time: float, responder: str, event: str, room: str):
-        """Log a simulation event."""
-        self.events.append((time, responder, event, room))
+    def log_event(self, time: float, responder: str, event: EventKind, room: str):
+        """
+        Log a simulation event.
+        
+        Args:
+            time: Simulation time of the event
+            responder: Name of the responder
+            event: Kind of event; a label such as "SWEPT" or "RESWEEP-NEEDED"
+                is also accepted and converted to its EventKind
+            room: ID of the room involved
+        """
+        if not isinstance(event, EventKind):
+            event = EventKind(EVENT_LABELS.index(event))
+        self._ev_time.append(time)
+        self._ev_resp.append(responder)
+        self._ev_kind.append(event)
+        self._ev_room.append(room)
+        if event == EventKind.SWEPT:
+            entry = (time, responder, EVENT_LABELS[event], room)
+            # Responders' clocks interleave, so insert in time order
+            # (after any equal times, matching a stable sort)
+            insort(self._events_swept, entry, key=itemgetter(0))
         
     def print_summary(self, results: Dict):
         """Print a summary of the simulation results."""
@@ -329,7 +400,7 @@ class SweepSimulation:
         # Show emergency type if applicable
         if self.building.emergency:
             emergency = self.building.emergency
-            print(f"\n🚨 Emergency Type: {emergency.emergency_type.value.upper()}")
+            print(f"\n🚨 Emergency Type: {emergency.emergency_type.label.upper()}")
             print(f"   Severity: {emergency.severity:.1f}x")
             if emergency.has_smoke:
                 print(f"   Smoke Density: {emergency.smoke_density:.1f}")
@@ -360,10 +431,12 @@ class SweepSimulation:
             print(f"    Strategy: {r_stats['strategy']}")
             
         print(f"\n📝 Event Timeline (first 20 events):")
-        for i, (time, responder, event, room) in enumerate(results['events'][:20]):
+        for i, (time, responder, event, room) in enumerate(self.iter_events()):
+            if i >= 20:
+                break
             print(f"  {time:6.1f}s - {responder:12s} {event:12s} {room}")
             
-        if len(results['events']) > 20:
-            print(f"  ... ({len(results['events']) - 20} more events)")
+        if self.num_events > 20:
+            print(f"  ... ({self.num_events - 20} more events)")
             
         print("\n" + "=" * 70 + "\n")
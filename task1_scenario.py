@@ -1,11 +1,17 @@
 """Task 1 scenario: Basic office building sweep with 2 firefighters."""
 
-from building import Building
+from typing import Optional
+
+from building import Building, BuildingSnapshot
 from room import Room, RoomType, OccupantType
 from responder import Responder, SweepStrategy, ExpertiseLevel
 from emergency import EmergencyContext, EmergencyType
 
 
+# Frozen Task 1 layout (rooms, paths and shortest-path tables), built on first use
+_TASK1_TEMPLATE: Optional[BuildingSnapshot] = None
+
+
 def create_task1_building(emergency_type: str = "fire_alarm") -> Building:
     """
     Create the Task 1 building scenario:
@@ -28,6 +34,22 @@ def create_task1_building(emergency_type: str = "fire_alarm") -> Building:
     Returns:
         Building object configured for Task 1
     """
+    return Building.from_snapshot(get_task1_template(emergency_type))
+
+
+def get_task1_template(emergency_type: str = "fire_alarm") -> BuildingSnapshot:
+    """
+    Get the frozen Task 1 layout under the given emergency, building it on first use.
+    
+    The snapshot is picklable, so worker processes can be handed it instead
+    of rebuilding the layout themselves.
+    
+    Args:
+        emergency_type: Type of emergency, as for create_task1_building
+    
+    Returns:
+        BuildingSnapshot to restore with Building.from_snapshot
+    """
     # Create appropriate emergency context
     emergency_contexts = {
         "fire_alarm": EmergencyContext(EmergencyType.FIRE, severity=1.0, smoke_density=0.3),
@@ -38,6 +60,16 @@ def create_task1_building(emergency_type: str = "fire_alarm") -> Building:
     }
     emergency = emergency_contexts.get(emergency_type, emergency_contexts["fire_alarm"])
     
+    global _TASK1_TEMPLATE
+    if _TASK1_TEMPLATE is None:
+        template = _build_task1_building(emergency)
+        template.precompute_distances()
+        _TASK1_TEMPLATE = template.snapshot()
+    return _TASK1_TEMPLATE._replace(emergency=emergency)
+
+
+def _build_task1_building(emergency: EmergencyContext) -> Building:
+    """Construct the Task 1 building room by room; see create_task1_building."""
     building = Building(name="Task 1 Office Building", emergency=emergency)
     
     # Create exits on opposite sides (left and right ends of building)
@@ -150,6 +182,7 @@ def create_task1_building(emergency_type: str = "fire_alarm") -> Building:
     building.add_path("Room2B", "Hallway_C", distance=8.0)
     building.add_path("Room2C", "Hallway_R", distance=8.0)
     
+    building.finalize()
     return building
 
 
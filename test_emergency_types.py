@@ -4,15 +4,40 @@ Test script for emergency type functionality.
 Compares different emergency types and their impact on sweep operations.
 """
 
-from building import Building
+from collections import namedtuple
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from building import Building, BuildingSnapshot
+from kernels import MIN_COMPILED_SIZE
 from room import Room, RoomType, OccupantType
+from room_batch import RoomBatch
 from responder import Responder, SweepStrategy, ExpertiseLevel
 from simulation import SweepSimulation
 from emergency import EmergencyContext, EmergencyType, PRESET_EMERGENCIES
 
 
+# Frozen layout of the test building, built on first use
+_TEMPLATE_BUILDING: Optional[BuildingSnapshot] = None
+
 def create_test_building(emergency: EmergencyContext) -> Building:
     """Create a simple 3-room building for testing."""
+    return Building.from_snapshot(_test_building_template()._replace(emergency=emergency))
+
+
+def _test_building_template() -> BuildingSnapshot:
+    """Get the frozen test building layout, building it on first use."""
+    global _TEMPLATE_BUILDING
+    if _TEMPLATE_BUILDING is None:
+        template = _build_test_building(None)
+        template.precompute_distances()
+        _TEMPLATE_BUILDING = template.snapshot()
+    return _TEMPLATE_BUILDING
+
+
+def _build_test_building(emergency: Optional[EmergencyContext]) -> Building:
+    """Construct the 3-room test building room by room."""
     building = Building(name="Emergency Test Building", emergency=emergency)
     
     # Create simple layout: Exit -> Hallway -> Office
@@ -61,6 +86,48 @@ def create_test_responders(emergency: EmergencyContext) -> list:
     return [ff1, ff2]
 
 
+# Both responders start every scenario at the exit
+_START_POSITIONS = {"FF1": "Exit", "FF2": "Exit"}
+
+# Outcome of one simulated scenario
+ScenarioResult = namedtuple('ScenarioResult', 'completion_time completion_time_minutes')
+
+
+def _scenario_key(emergency: EmergencyContext) -> Tuple:
+    """EmergencyContext fields that determine a run (hashable, unlike the context)."""
+    return (emergency.emergency_type, emergency.severity, emergency.has_smoke, emergency.smoke_density)
+
+
+def _simulate(key: Tuple) -> ScenarioResult:
+    """Run one scenario from its key."""
+    emergency_type, severity, has_smoke, smoke_density = key
+    emergency = EmergencyContext(emergency_type, severity=severity,
+                                 has_smoke=has_smoke, smoke_density=smoke_density)
+    building = create_test_building(emergency)
+    responders = create_test_responders(emergency)
+    simulation = SweepSimulation(building, responders)
+    simulation.assign_starting_positions(_START_POSITIONS)
+    results = simulation.run_simulation()
+    return ScenarioResult(results['completion_time'], results['completion_time_minutes'])
+
+
+def run_scenarios(emergencies: List[EmergencyContext]) -> List[ScenarioResult]:
+    """
+    Simulate the test building under each emergency, running equal emergencies only once.
+    
+    Results are not kept between calls, so every test runs the simulator.
+    
+    Args:
+        emergencies: Emergency conditions, one per run
+        
+    Returns:
+        ScenarioResult for each emergency, in order
+    """
+    keys = [_scenario_key(emergency) for emergency in emergencies]
+    results = {key: _simulate(key) for key in dict.fromkeys(keys)}
+    return [results[key] for key in keys]
+
+
 def test_emergency_comparison():
     """Compare different emergency types."""
     print("\n" + "=" * 80)
@@ -79,29 +146,23 @@ def test_emergency_comparison():
         ("Smoke Only", EmergencyContext(EmergencyType.SMOKE_NO_FIRE, smoke_density=0.6)),
     ]
     
-    results_comparison = []
-    
-    for name, emergency in emergency_scenarios:
-        building = create_test_building(emergency)
-        responders = create_test_responders(emergency)
-        
-        simulation = SweepSimulation(building, responders)
-        simulation.assign_starting_positions({"FF1": "Exit", "FF2": "Exit"})
-        
-        results = simulation.run_simulation()
-        
-        results_comparison.append({
+    scenario_results = run_scenarios([emergency for _, emergency in emergency_scenarios])
+    results_comparison = [
+        {
             'name': name,
-            'emergency_type': emergency.emergency_type.value,
+            'emergency_type': emergency.emergency_type.label,
             'noticeable': emergency.is_noticeable(),
-            'completion_time': results['completion_time'],
+            'completion_time': results.completion_time,
             'movement_multiplier': emergency.get_movement_speed_multiplier(),
             'visibility_multiplier': emergency.get_visibility_multiplier(),
             'occupant_response_multiplier': emergency.get_occupant_response_multiplier(),
             'sweep_difficulty': emergency.get_sweep_difficulty_multiplier(),
-        })
-        
-        print(f"✓ {name}: {results['completion_time']:.1f}s ({results['completion_time_minutes']:.2f}min)")
+        }
+        for (name, emergency), results in zip(emergency_scenarios, scenario_results)
+    ]
+    
+    for r, results in zip(results_comparison, scenario_results):
+        print(f"✓ {r['name']}: {results.completion_time:.1f}s ({results.completion_time_minutes:.2f}min)")
     
     # Print detailed comparison
     print("\n" + "-" * 80)
@@ -110,24 +171,27 @@ def test_emergency_comparison():
     print(f"{'Emergency':<20} {'Time':<10} {'Movement':<12} {'Visibility':<12} {'Occupant':<12} {'Notice'}")
     print("-" * 80)
     
+    lines = []
     for r in results_comparison:
         notice_str = "Yes" if r['noticeable'] else "No"
-        print(f"{r['name']:<20} {r['completion_time']:>6.1f}s   "
-              f"{r['movement_multiplier']:>6.2f}x     "
-              f"{r['visibility_multiplier']:>6.2f}x     "
-              f"{r['occupant_response_multiplier']:>6.2f}x     "
-              f"{notice_str}")
+        lines.append(f"{r['name']:<20} {r['completion_time']:>6.1f}s   "
+                     f"{r['movement_multiplier']:>6.2f}x     "
+                     f"{r['visibility_multiplier']:>6.2f}x     "
+                     f"{r['occupant_response_multiplier']:>6.2f}x     "
+                     f"{notice_str}")
+    print("\n".join(lines))
     
     print("-" * 80)
     
     # Find extremes
-    fastest = min(results_comparison, key=lambda x: x['completion_time'])
-    slowest = max(results_comparison, key=lambda x: x['completion_time'])
+    names = [r['name'] for r in results_comparison]
+    times = np.array([r['completion_time'] for r in results_comparison])
+    fastest, slowest = times.argmin(), times.argmax()
     
-    print(f"\n⚡ Fastest: {fastest['name']} ({fastest['completion_time']:.1f}s)")
-    print(f"🐌 Slowest: {slowest['name']} ({slowest['completion_time']:.1f}s)")
-    print(f"📊 Time difference: {slowest['completion_time'] - fastest['completion_time']:.1f}s "
-          f"({((slowest['completion_time'] / fastest['completion_time']) - 1) * 100:.0f}% slower)")
+    print(f"\n⚡ Fastest: {names[fastest]} ({times[fastest]:.1f}s)")
+    print(f"🐌 Slowest: {names[slowest]} ({times[slowest]:.1f}s)")
+    print(f"📊 Time difference: {times[slowest] - times[fastest]:.1f}s "
+          f"({((times[slowest] / times[fastest]) - 1) * 100:.0f}% slower)")
 
 
 def test_noticeable_vs_unnoticeable():
@@ -139,32 +203,23 @@ def test_noticeable_vs_unnoticeable():
     
     # Noticeable emergency (fire)
     fire = EmergencyContext(EmergencyType.FIRE, severity=1.0, smoke_density=0.5)
-    building_fire = create_test_building(fire)
-    responders_fire = create_test_responders(fire)
-    sim_fire = SweepSimulation(building_fire, responders_fire)
-    sim_fire.assign_starting_positions({"FF1": "Exit", "FF2": "Exit"})
-    results_fire = sim_fire.run_simulation()
     
     # Unnoticeable emergency (CO leak)
     co = EmergencyContext(EmergencyType.CO_LEAK, severity=1.0)
-    building_co = create_test_building(co)
-    responders_co = create_test_responders(co)
-    sim_co = SweepSimulation(building_co, responders_co)
-    sim_co.assign_starting_positions({"FF1": "Exit", "FF2": "Exit"})
-    results_co = sim_co.run_simulation()
+    results_fire, results_co = run_scenarios([fire, co])
     
     print(f"🔥 FIRE (noticeable):")
-    print(f"   Completion time: {results_fire['completion_time']:.1f}s")
+    print(f"   Completion time: {results_fire.completion_time:.1f}s")
     print(f"   Occupant response: {fire.get_occupant_response_multiplier():.2f}x (normal)")
     print(f"   Movement speed: {fire.get_movement_speed_multiplier():.2f}x")
     
     print(f"\n☠️  CO LEAK (unnoticeable):")
-    print(f"   Completion time: {results_co['completion_time']:.1f}s")
+    print(f"   Completion time: {results_co.completion_time:.1f}s")
     print(f"   Occupant response: {co.get_occupant_response_multiplier():.2f}x (DELAYED)")
     print(f"   Movement speed: {co.get_movement_speed_multiplier():.2f}x")
     
-    time_diff = results_co['completion_time'] - results_fire['completion_time']
-    percent_diff = (time_diff / results_fire['completion_time']) * 100
+    time_diff = results_co.completion_time - results_fire.completion_time
+    percent_diff = (time_diff / results_fire.completion_time) * 100
     
     print(f"\n📊 CO leak takes {time_diff:.1f}s longer ({percent_diff:.0f}% increase)")
     print(f"   Reason: Occupants may be unconscious or unaware of danger")
@@ -186,41 +241,30 @@ def test_smoke_impact():
         ("Dense Smoke", 1.0),
     ]
     
-    results = []
-    
-    for name, density in smoke_levels:
-        emergency = EmergencyContext(
+    emergencies = [
+        EmergencyContext(
             EmergencyType.FIRE,
             severity=1.0,
             has_smoke=density > 0,
             smoke_density=density
         )
-        
-        building = create_test_building(emergency)
-        responders = create_test_responders(emergency)
-        sim = SweepSimulation(building, responders)
-        sim.assign_starting_positions({"FF1": "Exit", "FF2": "Exit"})
-        result = sim.run_simulation()
-        
-        results.append({
-            'name': name,
-            'density': density,
-            'time': result['completion_time'],
-            'visibility_mult': emergency.get_visibility_multiplier(),
-            'movement_mult': emergency.get_movement_speed_multiplier(),
-        })
-        
-        print(f"  {name:<18} (density={density:.1f}): {result['completion_time']:>6.1f}s")
+        for _, density in smoke_levels
+    ]
+    times = np.array([result.completion_time for result in run_scenarios(emergencies)])
+    
+    for (name, density), time in zip(smoke_levels, times):
+        print(f"  {name:<18} (density={density:.1f}): {time:>6.1f}s")
     
     print("\n" + "-" * 80)
-    baseline = results[0]['time']
+    baseline = times[0]
     print(f"Impact of smoke on completion time (baseline = {baseline:.1f}s):")
     print("-" * 80)
     
-    for r in results[1:]:  # Skip "No Smoke"
-        increase = r['time'] - baseline
-        percent = (increase / baseline) * 100
-        print(f"  {r['name']:<18}: +{increase:>5.1f}s (+{percent:>4.0f}%)")
+    # Skip "No Smoke"
+    increases = times[1:] - baseline
+    percents = (increases / baseline) * 100
+    for (name, _), increase, percent in zip(smoke_levels[1:], increases, percents):
+        print(f"  {name:<18}: +{increase:>5.1f}s (+{percent:>4.0f}%)")
 
 
 def test_preset_emergencies():
@@ -230,15 +274,43 @@ def test_preset_emergencies():
     print("=" * 80)
     print("\nTesting built-in preset emergencies...\n")
     
-    for preset_name, emergency in PRESET_EMERGENCIES.items():
-        building = create_test_building(emergency)
-        responders = create_test_responders(emergency)
-        sim = SweepSimulation(building, responders)
-        sim.assign_starting_positions({"FF1": "Exit", "FF2": "Exit"})
-        results = sim.run_simulation()
-        
-        print(f"✓ {preset_name:<20}: {results['completion_time']:>6.1f}s "
-              f"({emergency.emergency_type.value}, severity={emergency.severity:.1f})")
+    preset_results = run_scenarios(list(PRESET_EMERGENCIES.values()))
+    for (preset_name, emergency), results in zip(PRESET_EMERGENCIES.items(), preset_results):
+        print(f"✓ {preset_name:<20}: {results.completion_time:>6.1f}s "
+              f"({emergency.emergency_type.label}, severity={emergency.severity:.1f})")
+
+
+
+def test_room_batch_matches_scalar():
+    """Check that RoomBatch.sweep_durations matches Room.calculate_sweep_duration exactly."""
+    print("\n" + "=" * 80)
+    print("ROOM BATCH CONSISTENCY TEST")
+    print("=" * 80)
+    
+    # Every room and occupant type, across visibility, smoke and occupancy
+    rooms = [
+        Room(f"{room_type.value}_{occupant_type.value}_{i}", area=5.0 + 7.5 * i,
+             room_type=room_type, occupant_type=occupant_type,
+             has_smoke=(i == 3), is_visible=(i % 2 == 0),
+             visible_fraction=(0.15, 0.35, 0.55, 0.95, 1.0)[i], expected_occupants=i % 3)
+        for room_type in RoomType
+        for occupant_type in OccupantType
+        for i in range(5)
+    ]
+    # A batch large enough to take the compiled path when Numba is installed
+    large = rooms * (MIN_COMPILED_SIZE // len(rooms) + 1)
+    emergencies = [None] + list(PRESET_EMERGENCIES.values())
+    
+    for batch_rooms in (rooms, large):
+        batch = RoomBatch(batch_rooms)
+        for emergency in emergencies:
+            for expertise in ExpertiseLevel:
+                for T in (None, 2.5):
+                    expected = [room.calculate_sweep_duration(expertise.value, T, emergency)
+                                for room in batch_rooms]
+                    actual = batch.sweep_durations(expertise.value, T, emergency)
+                    assert np.array_equal(actual, expected), (len(batch_rooms), emergency, expertise, T)
+        print(f"✓ {len(batch_rooms)} rooms match under {len(emergencies)} emergency settings")
 
 
 if __name__ == "__main__":
@@ -251,6 +323,7 @@ if __name__ == "__main__":
     test_noticeable_vs_unnoticeable()
     test_smoke_impact()
     test_preset_emergencies()
+    test_room_batch_matches_scalar()
     
     print("\n" + "=" * 80)
     print("✅ ALL EMERGENCY TYPE TESTS COMPLETED")
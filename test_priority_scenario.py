@@ -8,7 +8,9 @@ This scenario shows how different room types require different numbers of sweeps
 - STORAGE (Priority 1): Requires 1 sweep only (no check needed)
 """
 
-from building import Building
+from typing import Optional
+
+from building import Building, BuildingSnapshot
 from room import Room, RoomType, OccupantType
 from responder import Responder, SweepStrategy, ExpertiseLevel
 from simulation import SweepSimulation
@@ -143,35 +145,41 @@ def create_priority_test_building() -> Building:
     return building
 
 
-def run_priority_test():
-    """Run priority-based redundancy test."""
-    print("\n" + "="*80)
-    print("PRIORITY-BASED REDUNDANCY TEST SCENARIO")
-    print("="*80)
-    
-    # Create building
-    building = create_priority_test_building()
-    
-    print(f"\n📋 Building: {building.name}")
-    print(f"   Total Rooms: {len(building.get_all_rooms())}")
-    print(f"   Exits: {len(building.exits)}")
+# Frozen layout shared by both priority tests, built on first use
+_PRIORITY_BUILDING: Optional[BuildingSnapshot] = None
+
+
+def _priority_building(emergency: Optional[EmergencyContext] = None) -> Building:
+    """
+    Fresh, unswept copy of the priority test building.
     
-    print("\n🏢 Room Priority Breakdown:")
-    rooms_by_priority = {}
-    for room in building.get_all_rooms():
-        priority = room.priority_level
-        if priority not in rooms_by_priority:
-            rooms_by_priority[priority] = []
-        rooms_by_priority[priority].append(room)
-    
-    for priority in sorted(rooms_by_priority.keys(), reverse=True):
-        rooms = rooms_by_priority[priority]
-        print(f"\n   Priority {priority} ({len(rooms)} rooms):")
-        for room in rooms:
-            print(f"      • {room.room_id:12s} ({room.room_type.value:15s}) - "
-                  f"Requires {room.required_sweeps_count} sweep(s)")
+    Args:
+        emergency: Emergency context for the copy (None = the template's default)
+        
+    Returns:
+        Building restored from the shared template
+    """
+    global _PRIORITY_BUILDING
+    if _PRIORITY_BUILDING is None:
+        template = create_priority_test_building()
+        template.precompute_distances()
+        _PRIORITY_BUILDING = template.snapshot()
+    snap = _PRIORITY_BUILDING
+    if emergency is not None:
+        snap = snap._replace(emergency=emergency)
+    return Building.from_snapshot(snap)
+
+
+def _make_priority_responders(emergency: Optional[EmergencyContext] = None) -> list:
+    """
+    Create the three single-responder teams used by the priority tests.
     
-    # Create 3 teams of responders
+    Args:
+        emergency: Emergency context to give every responder (None = normal conditions)
+        
+    Returns:
+        Fresh list of Responder objects
+    """
     responders = [
         # Team 1
         Responder(
@@ -179,7 +187,8 @@ def run_priority_test():
             name="Alpha",
             strategy=SweepStrategy.NEAREST_FIRST,
             expertise=ExpertiseLevel.EXPERT,
-            team_id=1
+            team_id=1,
+            emergency_context=emergency
         ),
         # Team 2
         Responder(
@@ -187,7 +196,8 @@ def run_priority_test():
             name="Bravo",
             strategy=SweepStrategy.NEAREST_FIRST,
             expertise=ExpertiseLevel.INTERMEDIATE,
-            team_id=2
+            team_id=2,
+            emergency_context=emergency
         ),
         # Team 3
         Responder(
@@ -195,9 +205,40 @@ def run_priority_test():
             name="Charlie",
             strategy=SweepStrategy.NEAREST_FIRST,
             expertise=ExpertiseLevel.INTERMEDIATE,
-            team_id=3
+            team_id=3,
+            emergency_context=emergency
         ),
     ]
+    return responders
+
+
+def run_priority_test():
+    """Run priority-based redundancy test."""
+    print("\n" + "="*80)
+    print("PRIORITY-BASED REDUNDANCY TEST SCENARIO")
+    print("="*80)
+    
+    # Create building
+    building = _priority_building()
+    all_rooms = building.get_all_rooms()  # live view, reused by every report below
+    
+    print(f"\n📋 Building: {building.name}")
+    print(f"   Total Rooms: {len(all_rooms)}")
+    print(f"   Exits: {len(building.exits)}")
+    
+    print("\n🏢 Room Priority Breakdown:")
+    rooms_by_priority = building.rooms_by_priority()
+    priorities = sorted(rooms_by_priority, reverse=True)
+    
+    for priority in priorities:
+        rooms = rooms_by_priority[priority]
+        print(f"\n   Priority {priority} ({len(rooms)} rooms):")
+        for room in rooms:
+            print(f"      • {room.room_id:12s} ({room.room_type.value:15s}) - "
+                  f"Requires {room.required_sweeps_count} sweep(s)")
+    
+    # Create 3 teams of responders
+    responders = _make_priority_responders()
     
     print(f"\n👨‍🚒 Responders: {len(responders)} firefighters in {len(set(r.team_id for r in responders))} teams")
     for r in responders:
@@ -231,32 +272,42 @@ def run_priority_test():
     print(f"{'Room ID':<15} {'Type':<15} {'Priority':<10} {'Required':<10} {'Actual':<10} {'Teams':<20} {'Status'}")
     print("-" * 90)
     
-    for room in sorted(building.get_all_rooms(), key=lambda r: -r.priority_level):
-        teams = room.get_sweeping_teams()
-        status = "✅ Complete" if room.is_fully_swept() else "❌ Incomplete"
-        print(f"{room.room_id:<15} {room.room_type.value:<15} {room.priority_level:<10} "
-              f"{room.required_sweeps_count:<10} {room.actual_sweeps_count:<10} "
-              f"{','.join(str(t) for t in teams):<20} {status}")
+    # Sweep state is final now; read it once for both reports below
+    room_state = {
+        room.room_id: (tuple(room.get_sweeping_teams()), room.is_fully_swept(), room.actual_sweeps_count)
+        for room in all_rooms
+    }
+    
+    # Each table is printed with a single call
+    lines = []
+    for room in (room for priority in priorities for room in rooms_by_priority[priority]):
+        teams, fully_swept, actual = room_state[room.room_id]
+        status = "✅ Complete" if fully_swept else "❌ Incomplete"
+        lines.append(f"{room.room_id:<15} {room.room_type.value:<15} {room.priority_level:<10} "
+                     f"{room.required_sweeps_count:<10} {actual:<10} "
+                     f"{','.join(str(t) for t in teams):<20} {status}")
+    print("\n".join(lines))
     
     # Verify priority requirements
     print("\n🔍 Priority Requirement Verification:")
     all_correct = True
     
-    for priority in sorted(rooms_by_priority.keys(), reverse=True):
+    lines = []
+    for priority in priorities:
         rooms = rooms_by_priority[priority]
         priority_name = {5: "Critical", 4: "High", 3: "Medium", 2: "Low", 1: "Minimal"}
         
-        print(f"\n   Priority {priority} ({priority_name.get(priority, 'Unknown')}):")
+        lines.append(f"\n   Priority {priority} ({priority_name.get(priority, 'Unknown')}):")
         for room in rooms:
             expected = room.required_sweeps_count
-            actual = room.actual_sweeps_count
-            teams = room.get_sweeping_teams()
+            teams, _, actual = room_state[room.room_id]
             
             if actual >= expected and len(teams) >= expected:
-                print(f"      ✅ {room.room_id}: {actual}/{expected} sweeps by {len(teams)} teams")
+                lines.append(f"      ✅ {room.room_id}: {actual}/{expected} sweeps by {len(teams)} teams")
             else:
-                print(f"      ❌ {room.room_id}: {actual}/{expected} sweeps by {len(teams)} teams (FAILED)")
+                lines.append(f"      ❌ {room.room_id}: {actual}/{expected} sweeps by {len(teams)} teams (FAILED)")
                 all_correct = False
+    print("\n".join(lines))
     
     print("\n" + "="*80)
     if all_correct and results['fully_swept']:
@@ -282,25 +333,16 @@ def run_priority_test_with_emergency():
         smoke_density=2.0
     )
     
-    building = create_priority_test_building()
-    building.emergency = emergency
+    building = _priority_building(emergency)
     
-    print(f"\n🚨 Emergency: {emergency.emergency_type.value.upper()}")
+    print(f"\n🚨 Emergency: {emergency.emergency_type.label.upper()}")
     print(f"   Severity: {emergency.severity}x")
     print(f"   Smoke: {'Yes' if emergency.has_smoke else 'No'}")
     if emergency.has_smoke:
         print(f"   Smoke Density: {emergency.smoke_density}")
     
-    # Create responders
-    responders = [
-        Responder("FF-Alpha", "Alpha", SweepStrategy.NEAREST_FIRST, ExpertiseLevel.EXPERT, team_id=1),
-        Responder("FF-Bravo", "Bravo", SweepStrategy.NEAREST_FIRST, ExpertiseLevel.INTERMEDIATE, team_id=2),
-        Responder("FF-Charlie", "Charlie", SweepStrategy.NEAREST_FIRST, ExpertiseLevel.INTERMEDIATE, team_id=3),
-    ]
-    
-    # Set emergency context for all responders
-    for r in responders:
-        r.set_emergency_context(emergency)
+    # Create responders with the emergency context
+    responders = _make_priority_responders(emergency)
     
     sim = SweepSimulation(building, responders)
     sim.assign_starting_positions({
@@ -95,7 +95,7 @@ def test_sweep_check_resweep_cycle():
     
     # Print events
     print(f"\n📝 Event Timeline:")
-    for time, responder, event, room in results['events']:
+    for time, responder, event, room in simulation.iter_events():
         print(f"   {time:6.1f}s - {responder:20s} {event:12s} {room}")
     
     # Verify sweep/check behavior
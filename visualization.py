@@ -1,10 +1,44 @@
 """Visualization utilities for building layouts and simulation results."""
 
+import io
+from collections import defaultdict
 from building import Building
 from room import RoomType
 import json
 import matplotlib.pyplot as plt
 import networkx as nx
+import numpy as np
+from matplotlib.collections import LineCollection
+from matplotlib.patches import Patch
+
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    HAVE_ORJSON = False
+
+# Largest number of paths plot_building_layout labels with their distances
+MAX_EDGE_LABELS = 20
+
+# (face color, edge color) of plotted rooms by type; offices are shown unswept here
+ROOM_STYLES = {
+    RoomType.EXIT: ('lightgreen', 'darkgreen'),
+    RoomType.HALLWAY: ('lightblue', 'blue'),
+    RoomType.OFFICE: ('lightyellow', 'orange'),
+}
+SWEPT_OFFICE_STYLE = ('lightcoral', 'darkred')
+DEFAULT_ROOM_STYLE = ('lightgray', 'black')
+
+# Legend of plot_building_layout (legends copy the handles' properties, so these are shared)
+LEGEND_ELEMENTS = [
+    Patch(facecolor=face, edgecolor=edge, label=label, linewidth=2)
+    for (face, edge), label in (
+        (ROOM_STYLES[RoomType.EXIT], 'Exit'),
+        (ROOM_STYLES[RoomType.HALLWAY], 'Hallway'),
+        (ROOM_STYLES[RoomType.OFFICE], 'Office (Unswept)'),
+        (SWEPT_OFFICE_STYLE, 'Office (Swept)'),
+    )
+]
 
 
 def visualize_building_ascii(building: Building) -> str:
@@ -17,26 +51,31 @@ def visualize_building_ascii(building: Building) -> str:
     Returns:
         String with ASCII art representation
     """
-    output = []
-    output.append("\nBuilding Layout:")
-    output.append("=" * 60)
-    
-    # Group rooms by type
-    exits = [r for r in building.get_all_rooms() if r.room_type == RoomType.EXIT]
-    hallways = [r for r in building.get_all_rooms() if r.room_type == RoomType.HALLWAY]
-    offices = [r for r in building.get_all_rooms() if r.room_type == RoomType.OFFICE]
-    
-    output.append("\nExits:")
+    # Every line is written with its trailing newline except the last
+    buf = io.StringIO()
+    w = buf.write
+    w("\nBuilding Layout:\n")
+    w("=" * 60 + "\n")
+    
+    # Group rooms by type in one pass
+    exits, hallways, offices = [], [], []
+    buckets = {RoomType.EXIT: exits, RoomType.HALLWAY: hallways, RoomType.OFFICE: offices}
+    for r in building.get_all_rooms():
+        bucket = buckets.get(r.room_type)
+        if bucket is not None:
+            bucket.append(r)
+    
+    w("\nExits:\n")
     for room in exits:
         status = "✓" if room.is_swept else "✗"
-        output.append(f"  [{status}] {room.room_id:15s} - {room.area:.0f} m²")
+        w(f"  [{status}] {room.room_id:15s} - {room.area:.0f} m²\n")
     
-    output.append("\nHallways:")
+    w("\nHallways:\n")
     for room in hallways:
         status = "✓" if room.is_swept else "✗"
-        output.append(f"  [{status}] {room.room_id:15s} - {room.area:.0f} m²")
+        w(f"  [{status}] {room.room_id:15s} - {room.area:.0f} m²\n")
     
-    output.append("\nOffices:")
+    w("\nOffices:\n")
     for room in offices:
         status = "✓" if room.is_swept else "✗"
         smoke = "🔥" if room.has_smoke else ""
@@ -48,28 +87,36 @@ def visualize_building_ascii(building: Building) -> str:
             team_info += f" [Checked by T{room.checked_by_team}]"
         if room.needs_resweep:
             team_info += " [⚠️ NEEDS RESWEEP]"
-        output.append(f"  [{status}] {room.room_id:15s} - {room.area:.0f} m² {smoke}{visibility}{team_info}")
+        w(f"  [{status}] {room.room_id:15s} - {room.area:.0f} m² {smoke}{visibility}{team_info}\n")
     
-    output.append("\nConnections:")
-    edges = list(building.graph.edges(data=True))
-    for room1, room2, data in edges:
-        distance = data.get('distance', 0)
-        output.append(f"  {room1:15s} <--{distance:5.1f}m--> {room2}")
+    w("\nConnections:\n")
+    for room1, room2, distance in building.graph.edges(data='distance', default=0):
+        w(f"  {room1:15s} <--{distance:5.1f}m--> {room2}\n")
     
-    output.append("=" * 60)
-    return "\n".join(output)
+    w("=" * 60)
+    return buf.getvalue()
 
 
 def export_results_json(results: dict, filename: str = "results.json"):
     """
     Export simulation results to JSON file.
     
+    Uses orjson when it is installed, otherwise the standard json module.
+    
     Args:
         results: Simulation results dictionary
         filename: Output filename
     """
-    with open(filename, 'w') as f:
-        json.dump(results, f, indent=2)
+    if HAVE_ORJSON:
+        data = orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                            | orjson.OPT_NON_STR_KEYS)
+        with open(filename, 'wb') as f:
+            f.write(data)
+    else:
+        # Encode in memory and write once; json.dump issues a write per token
+        data = json.dumps(results, indent=2)
+        with open(filename, 'w') as f:
+            f.write(data)
     print(f"\n💾 Results exported to {filename}")
 
 
@@ -97,35 +144,35 @@ def create_summary_report(results: dict) -> str:
         report.append(f"Rooms Re-swept (due to redundancy): {results['resweep_count']}")
     
     report.append("\nResponder Efficiency (by Team):")
-    # Group responders by team
-    teams = {}
+    # Group responders by team, totaling the key metrics in the same pass
+    teams = defaultdict(list)
+    total_sweep_time = total_distance = 0
     for r in results['responder_stats']:
-        team_id = r.get('team_id', 'None')
-        if team_id not in teams:
-            teams[team_id] = []
-        teams[team_id].append(r)
+        teams[r.get('team_id', 'None')].append(r)
+        total_sweep_time += r['total_sweep_time']
+        total_distance += r['total_distance']
     
     for team_id in sorted(teams.keys()):
         team_responders = teams[team_id]
         team_str = f"Team {team_id}" if team_id != 'None' else "Unassigned"
         report.append(f"\n  {team_str}:")
         
-        team_swept = sum(r['rooms_swept'] for r in team_responders)
-        team_checked = sum(r.get('rooms_checked', 0) for r in team_responders)
-        team_distance = sum(r['total_distance'] for r in team_responders)
-        
+        # Per-responder lines and team totals in one pass
+        team_swept = team_checked = team_distance = 0
         for r in team_responders:
-            efficiency = r['rooms_swept'] / (r['total_time'] / 60) if r['total_time'] > 0 else 0
-            report.append(f"    {r['name']}: {r['rooms_swept']} swept, "
-                         f"{r.get('rooms_checked', 0)} checked, "
-                         f"{efficiency:.2f} rooms/min")
+            swept = r['rooms_swept']
+            checked = r.get('rooms_checked', 0)
+            total_time = r['total_time']
+            team_swept += swept
+            team_checked += checked
+            team_distance += r['total_distance']
+            efficiency = swept / (total_time / 60) if total_time > 0 else 0
+            report.append(f"    {r['name']}: {swept} swept, {checked} checked, {efficiency:.2f} rooms/min")
         
         report.append(f"    Team totals: {team_swept} swept, {team_checked} checked, "
                      f"{team_distance:.1f}m traveled")
     
     report.append("\nKey Metrics:")
-    total_sweep_time = sum(r['total_sweep_time'] for r in results['responder_stats'])
-    total_distance = sum(r['total_distance'] for r in results['responder_stats'])
     report.append(f"  Combined sweep time: {total_sweep_time:.1f} seconds")
     report.append(f"  Combined distance traveled: {total_distance:.1f} meters")
     
@@ -134,15 +181,22 @@ def create_summary_report(results: dict) -> str:
     return "\n".join(report)
 
 
-def plot_building_layout(building: Building, save_path: str = None, show: bool = True):
+def plot_building_layout(building: Building, save_path: str = None, show: bool = True, dpi: int = 150):
     """
     Create a network plot of the building layout.
     
     Args:
         building: Building to visualize
         save_path: Optional path to save the plot
-        show: Whether to display the plot
+        show: Whether to display the plot (otherwise the figure is closed once saved)
+        dpi: Resolution of the saved image
+        
+    Returns:
+        Tuple (fig, ax), or (None, None) if the plot is neither saved nor shown
     """
+    if not show and save_path is None:
+        return None, None
+    
     fig, ax = plt.subplots(figsize=(16, 10))
     
     # Create custom positions for Task 1 building layout
@@ -167,92 +221,72 @@ def plot_building_layout(building: Building, save_path: str = None, show: bool =
     pos['Room2B'] = (2, 0)
     pos['Room2C'] = (4, 0)
     
-    # For any rooms not in the predefined layout, use spring layout
-    predefined_rooms = set(pos.keys())
-    all_rooms = set(building.graph.nodes())
-    undefined_rooms = all_rooms - predefined_rooms
+    # Place any rooms not in the predefined layout below it
+    undefined_rooms = [room_id for room_id in building.graph.nodes() if room_id not in pos]
     
-    if undefined_rooms:
+    if len(undefined_rooms) <= 4:
+        # A few rooms fit on a small grid; no need for a force-directed layout
+        for i, node in enumerate(undefined_rooms):
+            pos[node] = (2 + (i % 3), -1 - (i // 3))
+    else:
         # Use spring layout only for undefined rooms
         temp_graph = building.graph.subgraph(undefined_rooms)
-        temp_pos = nx.spring_layout(temp_graph, k=1, iterations=50)
+        temp_pos = nx.spring_layout(temp_graph, k=1, iterations=20, seed=0)
         # Offset to avoid overlap
         for node, coord in temp_pos.items():
             pos[node] = (coord[0] * 2 + 2, coord[1] * 2 - 1)
     
-    # Categorize nodes by room type
-    exits = [r.room_id for r in building.get_all_rooms() if r.room_type == RoomType.EXIT]
-    hallways = [r.room_id for r in building.get_all_rooms() if r.room_type == RoomType.HALLWAY]
-    offices = [r.room_id for r in building.get_all_rooms() if r.room_type == RoomType.OFFICE]
-    swept_rooms = [r.room_id for r in building.get_all_rooms() if r.is_swept]
-    other_rooms = [r.room_id for r in building.get_all_rooms() 
-                   if r.room_type not in [RoomType.EXIT, RoomType.HALLWAY, RoomType.OFFICE]]
+    # Resolve node styles and build labels in one pass; exits are drawn separately as squares
+    exits = []
+    nodelist, node_color, edgecolors = [], [], []
+    labels = {}
+    for room in building.get_all_rooms():
+        room_id = room.room_id
+        if room.room_type == RoomType.EXIT:
+            exits.append(room_id)
+        else:
+            if room.room_type == RoomType.OFFICE and room.is_swept:
+                face, edge = SWEPT_OFFICE_STYLE
+            else:
+                face, edge = ROOM_STYLES.get(room.room_type, DEFAULT_ROOM_STYLE)
+            nodelist.append(room_id)
+            node_color.append(face)
+            edgecolors.append(edge)
+        swept = "✓" if room.is_swept else ""
+        smoke = "🔥" if room.has_smoke else ""
+        visibility = "🌫️" if not room.is_visible and not room.has_smoke else ""
+        labels[room_id] = f"{room_id}\n{room.area:.0f}m²{swept}{smoke}{visibility}"
     
-    # Draw edges with distances as labels
-    nx.draw_networkx_edges(building.graph, pos, width=3, alpha=0.6, edge_color='gray', ax=ax)
+    # Draw edges as one line collection (distances are added as labels below)
+    segments = np.array([(pos[u], pos[v]) for u, v in building.graph.edges()], dtype=float).reshape(-1, 2, 2)
+    ax.add_collection(LineCollection(segments, colors='gray', linewidths=3, alpha=0.6, zorder=1))
     
-    # Draw edge labels (distances)
-    edge_labels = nx.get_edge_attributes(building.graph, 'distance')
-    edge_labels = {k: f"{v:.1f}m" for k, v in edge_labels.items()}
-    nx.draw_networkx_edge_labels(building.graph, pos, edge_labels, font_size=10, 
-                                 font_weight='bold', ax=ax)
+    # Draw edge labels (distances); skipped on dense layouts where they would be unreadable
+    if building.graph.number_of_edges() <= MAX_EDGE_LABELS:
+        edge_labels = {(u, v): f"{d:.1f}m" for u, v, d in building.graph.edges(data='distance', default=0)}
+        nx.draw_networkx_edge_labels(building.graph, pos, edge_labels, font_size=10, 
+                                     font_weight='bold', ax=ax)
     
-    # Draw nodes by category with different colors
+    # Draw nodes as scatter markers, colored by category (size in points², as networkx uses)
     node_size = 3500
     
-    # Draw exits (green)
     if exits:
-        nx.draw_networkx_nodes(building.graph, pos, nodelist=exits, 
-                              node_color='lightgreen', node_size=node_size,
-                              node_shape='s', edgecolors='darkgreen', linewidths=4, ax=ax)
-    
-    # Draw hallways (light blue)
-    if hallways:
-        nx.draw_networkx_nodes(building.graph, pos, nodelist=hallways,
-                              node_color='lightblue', node_size=node_size,
-                              node_shape='o', edgecolors='blue', linewidths=3, ax=ax)
-    
-    # Draw offices - swept vs unswept
-    if offices:
-        swept_offices = [r for r in offices if r in swept_rooms]
-        unswept_offices = [r for r in offices if r not in swept_rooms]
-        
-        if swept_offices:
-            nx.draw_networkx_nodes(building.graph, pos, nodelist=swept_offices,
-                                  node_color='lightcoral', node_size=node_size,
-                                  node_shape='o', edgecolors='darkred', linewidths=3, ax=ax)
-        if unswept_offices:
-            nx.draw_networkx_nodes(building.graph, pos, nodelist=unswept_offices,
-                                  node_color='lightyellow', node_size=node_size,
-                                  node_shape='o', edgecolors='orange', linewidths=3, ax=ax)
-    
-    # Draw other rooms
-    if other_rooms:
-        nx.draw_networkx_nodes(building.graph, pos, nodelist=other_rooms,
-                              node_color='lightgray', node_size=node_size,
-                              node_shape='o', edgecolors='black', linewidths=3, ax=ax)
+        face, edge = ROOM_STYLES[RoomType.EXIT]
+        xy = np.array([pos[room_id] for room_id in exits], dtype=float)
+        ax.scatter(xy[:, 0], xy[:, 1], s=node_size, c=face, marker='s',
+                   edgecolors=edge, linewidths=4, zorder=2)
     
-    # Draw labels
-    labels = {}
-    for room in building.get_all_rooms():
-        area = room.area
-        swept = "✓" if room.is_swept else ""
-        smoke = "🔥" if room.has_smoke else ""
-        visibility = "🌫️" if not room.is_visible and not room.has_smoke else ""
-        labels[room.room_id] = f"{room.room_id}\n{area:.0f}m²{swept}{smoke}{visibility}"
+    if nodelist:
+        xy = np.array([pos[room_id] for room_id in nodelist], dtype=float)
+        ax.scatter(xy[:, 0], xy[:, 1], s=node_size, c=node_color, marker='o',
+                   edgecolors=edgecolors, linewidths=3, zorder=2)
     
+    # Draw labels
     nx.draw_networkx_labels(building.graph, pos, labels, font_size=10, 
                            font_weight='bold', ax=ax)
     
     # Add legend
-    from matplotlib.patches import Patch
-    legend_elements = [
-        Patch(facecolor='lightgreen', edgecolor='darkgreen', label='Exit', linewidth=2),
-        Patch(facecolor='lightblue', edgecolor='blue', label='Hallway', linewidth=2),
-        Patch(facecolor='lightyellow', edgecolor='orange', label='Office (Unswept)', linewidth=2),
-        Patch(facecolor='lightcoral', edgecolor='darkred', label='Office (Swept)', linewidth=2),
-    ]
-    ax.legend(handles=legend_elements, loc='upper right', fontsize=12, framealpha=0.9)
+    ax.legend(handles=LEGEND_ELEMENTS, loc='upper right', fontsize=12, framealpha=0.9)
     
     # Set title and formatting
     stats = building.get_building_stats()
@@ -260,19 +294,24 @@ def plot_building_layout(building: Building, save_path: str = None, show: bool =
     ax.set_title(title, fontsize=16, fontweight='bold', pad=20)
     ax.axis('off')
     
-    # Set axis limits with padding
-    ax.set_xlim(-1.5, 5.5)
-    ax.set_ylim(-0.5, 2.5)
+    # Set axis limits with padding, widened to take in any rooms placed off the Task 1 layout
+    xy = np.array(list(pos.values()), dtype=float)
+    (x_min, y_min), (x_max, y_max) = xy.min(axis=0), xy.max(axis=0)
+    ax.set_xlim(min(-1.5, x_min - 0.5), max(5.5, x_max + 0.5))
+    ax.set_ylim(min(-0.5, y_min - 0.5), max(2.5, y_max + 0.5))
     
-    plt.tight_layout()
+    # Fixed margins, so saving needs no extra 'tight' bounding-box pass
+    fig.subplots_adjust(left=0.01, right=0.99, bottom=0.01, top=0.9)
     
     # Save if path provided
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        fig.savefig(save_path, dpi=dpi)
         print(f"📊 Building plot saved to {save_path}")
     
-    # Show if requested
+    # Show if requested; otherwise free the canvas now
     if show:
         plt.show()
+    else:
+        plt.close(fig)
     
     return fig, ax